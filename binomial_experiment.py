@@ -1,7 +1,10 @@
+import logging
+import multiprocessing as mp
+import os
 import random
 import pathlib
 
-from typing import Optional
+from typing import NamedTuple, Optional, Tuple
 
 import click
 from src.schnapsen.bots.rdeep_ML import RdeepMLBot
@@ -11,26 +14,84 @@ from src.schnapsen.game import (Bot, Move, PlayerPerspective,
                             SchnapsenGamePlayEngine, Trump_Exchange)
 from src.schnapsen.twenty_four_card_schnapsen import \
     TwentyFourSchnapsenGamePlayEngine
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from scipy.stats import binomtest
+from scipy.stats import binom
+
+logger = logging.getLogger(__name__)
+
+# The engine and bots of a worker process, created once by _init_worker and reused for every game the worker plays.
+# Instead of making new bots for every game, the random number generators of the bots are reseeded with the number of the game,
+# so the outcome of a game only depends on its number, not on which worker process plays it, or on what that worker played before.
+_engine: SchnapsenGamePlayEngine
+_bot_under_test: RdeepBot
+_opponent: RdeepBot
+_bot_under_test_rng = random.Random()
+_opponent_rng = random.Random()
+# The random number generator of the games of a worker process, reseeded with the number of each game rather than recreated for it
+_game_rng = random.Random()
+# The seeds of the bots in the first game, every later game adds its number to them
+BOT_UNDER_TEST_SEED = 4564654644
+OPPONENT_SEED = 464566
+
+
+class BinomResult(NamedTuple):
+    """The outcome of a binomial experiment, with the fields of scipy's BinomTestResult which are used from it"""
+    k: int
+    n: int
+    pvalue: float
+
+
+def binom_pvalue(wins: npt.ArrayLike, amount: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """
+    The one sided ('greater') p value of winning `wins` out of `amount` games against an equally strong bot.
+    This is the exact binomial tail, as binomtest computes it, but without its per call overhead.
+    Both arguments can be arrays, to get the p values of a whole sweep of experiments in one call.
+    """
+    return binom.sf(np.asarray(wins) - 1, amount, 0.5)
+
+
+def _init_worker(samples: int, depth: int) -> None:
+    """Create the engine and the bots once per worker process, rather than once per game."""
+    global _engine, _bot_under_test, _opponent
+    _engine = SchnapsenGamePlayEngine()
+    _bot_under_test = RdeepBot(num_samples=samples, depth=depth, rand=_bot_under_test_rng)
+    _opponent = RdeepBot(num_samples=6, depth=6, rand=_opponent_rng)
+
+
+def _play_one(game_number: int) -> Tuple[bool, int]:
+    """
+    Play a single game of the experiment with the bots of this worker process, seeded for this game.
+
+    :param game_number: the number of the game
+    :returns: whether the bot under test won, and the number of the game played
+    """
+    _bot_under_test_rng.seed(BOT_UNDER_TEST_SEED + game_number)
+    _opponent_rng.seed(OPPONENT_SEED + game_number)
+    lead, follower = (_opponent, _bot_under_test) if game_number % 2 == 0 else (_bot_under_test, _opponent)
+    _game_rng.seed(game_number)
+    winner_id, _, _ = _engine.play_game(lead, follower, _game_rng)
+    return winner_id is _bot_under_test, game_number
+
 
 def binom_experiment(amount, samples, depth):
-    bot1: Bot
-    bot2: Bot
-    engine = SchnapsenGamePlayEngine()
+    """
+    Play amount games between the bot under test, a RdeepBot with the given samples and depth, and a RdeepBot with 6 samples and depth 6 as opponent,
+    and test whether the bot under test wins more than half of them.
+    The progress is logged at INFO level, callers have to configure logging to see it, for example with logging.basicConfig(level=logging.INFO).
+
+    :returns: the result of the test, and its p value
+    """
     win = 0
-    for game_number in range(1, amount + 1):
-        #rdeep_ML = bot1 = RdeepMLBot(num_samples=samples, depth=depth, rand=random.Random(4564654644))
-        rdeep_ML = bot1 = RdeepBot(num_samples=6, depth=6, rand=random.Random(4564654644))
-        bot2 = RdeepBot(num_samples=6, depth=6, rand=random.Random(4564654644))
-        if game_number % 2 == 0:
-            bot1, bot2 = bot2, bot1
-        winner_id, _, _ = engine.play_game(bot1, bot2, random.Random(game_number))
-        if winner_id == rdeep_ML:
-            win += 1
-        if game_number % 50 == 0:
-            print(str(game_number) + " Game has finished")
-    result = binomtest(win, n=amount, p=0.5, alternative='greater')
-    p_value = result.pvalue
+    with mp.Pool(processes=os.cpu_count(), initializer=_init_worker, initargs=(samples, depth)) as pool:
+        games = pool.imap_unordered(_play_one, range(1, amount + 1), chunksize=8)
+        for finished, (bot_under_test_won, _) in enumerate(games, start=1):
+            if bot_under_test_won:
+                win += 1
+            if finished % 50 == 0:
+                logger.info("%d Game has finished", finished)
+    p_value = float(binom_pvalue(win, amount))
+    result = BinomResult(k=win, n=amount, pvalue=p_value)
     return result, p_value
     
\ No newline at end of file
@@ -1,11 +1,14 @@
+import logging
+import multiprocessing as mp
+import os
 import random
 import pathlib
 
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 import click
 from src.schnapsen.bots.rdeep_ML import RdeepMLBot
-from src.schnapsen.bots import MLDataBot, train_ML_model, MLPlayingBot, RandBot, BullyBot
+from src.schnapsen.bots import MLDataBot, ReplayMemoryWriter, train_ML_model, MLPlayingBot, RandBot, BullyBot
 from src.schnapsen.bots.example_bot import ExampleBot
 
 from src.schnapsen.game import (Bot, Move, PlayerPerspective,
@@ -16,26 +19,83 @@ from src.schnapsen.bots.bot2 import SecondBot
 from src.schnapsen.bots.rdeep import RdeepBot
 from binomial_experiment import binom_experiment
 
+logger = logging.getLogger(__name__)
+
 @click.group()
 def main() -> None:
     """Various Schnapsen Game Examples"""
+    # the progress of the longer runs is logged, rather than printed
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+# The engine and bots of a worker process, set once by _init_worker and reused for every game the worker plays.
+# Instead of copying the bots for every game, their random number generators are reseeded with the number of the game, see _play_one.
+_engine: SchnapsenGamePlayEngine
+_bot1: Bot
+_bot2: Bot
+# The random number generator of the games of a worker process, reseeded with the number of each game rather than recreated for it
+_game_rng = random.Random()
+# The seeds of the bots in the first game, every later game adds its number to them
+BOT1_SEED = 12112121
+BOT2_SEED = 464566
+
+
+def _init_worker(engine: SchnapsenGamePlayEngine, bot1: Bot, bot2: Bot) -> None:
+    """Receive the engine and the bots once per worker process, rather than once per game."""
+    global _engine, _bot1, _bot2
+    _engine, _bot1, _bot2 = engine, bot1, bot2
+
+
+def _reseed_bot(bot: Bot, seed: int) -> None:
+    """
+    Seed the random number generators the bot keeps in its attributes, also those of the bots it wraps.
+    The bots are created by the caller, so their random number generators can only be found this way. Bots without one are left as they are.
+    """
+    for value in getattr(bot, "__dict__", {}).values():
+        if isinstance(value, random.Random):
+            value.seed(seed)
+        elif isinstance(value, Bot):
+            _reseed_bot(value, seed)
+
+
+def _play_one(game_number: int) -> Tuple[bool, int]:
+    """
+    Play a single game between the bots of this worker process, seeded for this game.
+    So the outcome of a game only depends on its number, not on which worker process plays it, or on what that worker played before.
+    On even game numbers bot2 leads, so both start the same number of times.
+    This function is used by the worker processes, hence it reports whether bot1 won, rather than the winning bot.
+
+    :returns: whether bot1 won, and the number of the game played
+    """
+    _reseed_bot(_bot1, BOT1_SEED + game_number)
+    _reseed_bot(_bot2, BOT2_SEED + game_number)
+    lead, follower = (_bot2, _bot1) if game_number % 2 == 0 else (_bot1, _bot2)
+    _game_rng.seed(game_number)
+    winner, _, _ = _engine.play_game(lead, follower, _game_rng)
+    return winner is _bot1, game_number
+
+
+def _play_games(engine: SchnapsenGamePlayEngine, bot1: Bot, bot2: Bot, number_of_games: int) -> Iterator[bool]:
+    """
+    Play number_of_games games between bot1 and bot2 spread over all cores.
+    Yields for each finished game whether bot1 won. The games finish in arbitrary order.
+    """
+    with mp.Pool(processes=os.cpu_count(), initializer=_init_worker, initargs=(engine, bot1, bot2)) as pool:
+        for bot1_won, _ in pool.imap_unordered(_play_one, range(1, number_of_games + 1), chunksize=8):
+            yield bot1_won
+
 
 def play_games_and_return_stats(engine: SchnapsenGamePlayEngine, bot1: Bot, bot2: Bot, number_of_games: int) -> int:
     """
     Play number_of_games games between bot1 and bot2, using the SchnapsenGamePlayEngine, and return how often bot1 won.
-    Prints progress.
+    The progress is logged at INFO level. The commands of this cli configure logging to show it (see main),
+    other callers have to configure logging themselves, for example with logging.basicConfig(level=logging.INFO).
     """
     bot1_wins: int = 0
-    lead, follower = bot1, bot2
-    for i in range(1, number_of_games + 1):
-        if i % 2 == 0:
-            # swap bots so both start the same number of times
-            lead, follower = follower, lead
-        winner, _, _ = engine.play_game(lead, follower, random.Random(i))
-        if winner == bot1:
+    for i, bot1_won in enumerate(_play_games(engine, bot1, bot2, number_of_games), start=1):
+        if bot1_won:
             bot1_wins += 1
         if i % 500 == 0:
-            print(f"Progress: {i}/{number_of_games}")
+            logger.info("Progress: %d/%d", i, number_of_games)
     return bot1_wins
 
 
@@ -90,39 +150,29 @@ def try_example_bot_game() -> None:
 
 @main.command()
 def rdeep_game() -> None:
-    bot1: Bot
-    bot2: Bot
     engine = SchnapsenGamePlayEngine()
-    rdeep = bot1 = RdeepBot(num_samples=12, depth=6, rand=random.Random(4564654644))
+    rdeep = RdeepBot(num_samples=12, depth=6, rand=random.Random(4564654644))
     bot2 = RandBot(464566)
     wins = 0
     amount = 100
-    for game_number in range(1, amount + 1):
-        if game_number % 2 == 0:
-            bot1, bot2 = bot2, bot1
-        winner_id, _, _ = engine.play_game(bot1, bot2, random.Random(game_number))
-        if winner_id == rdeep:
+    for game_number, rdeep_won in enumerate(_play_games(engine, rdeep, bot2, amount), start=1):
+        if rdeep_won:
             wins += 1
         if game_number % 10 == 0:
-            print(f"won {wins} out of {game_number}")
+            logger.info("won %d out of %d", wins, game_number)
 
 @main.command()
 def rdeepML_game() -> None:
-    bot1: Bot
-    bot2: Bot
     engine = SchnapsenGamePlayEngine()
-    rdeep = bot1 = RdeepMLBot(num_samples=8, depth=6, rand=random.Random(4564654644))
+    rdeep = RdeepMLBot(num_samples=8, depth=6, rand=random.Random(4564654644))
     bot2 = RandBot(random.Random(464566))
     wins = 0
     amount = 100
-    for game_number in range(1, amount + 1):
-        if game_number % 2 == 0:
-            bot1, bot2 = bot2, bot1
-        winner_id, _, _ = engine.play_game(bot1, bot2, random.Random(game_number))
-        if winner_id == rdeep:
+    for game_number, rdeep_won in enumerate(_play_games(engine, rdeep, bot2, amount), start=1):
+        if rdeep_won:
             wins += 1
         if game_number % 10 == 0:
-            print(f"won {wins} out of {game_number}")
+            logger.info("won %d out of %d", wins, game_number)
             
             
 @main.group()
@@ -132,6 +182,12 @@ def ml() -> None:
 
 @ml.command()
 def create_replay_memory_dataset() -> None:
+    """
+    Record the replay memories of RdeepBot against RdeepBot games.
+
+    The records are stored as text lines. A replay_memory_filename ending in .f16 stores them in the binary format instead
+    (see ml_bot.BINARY_REPLAY_MEMORY_SUFFIX), which is about half the size, but rounds the card probabilities to about three digits.
+    """
     # define replay memory database creation parameters
     num_of_games: int = 10000
     replay_memory_dir: str = 'ML_replay_memories'
@@ -156,17 +212,27 @@ def create_replay_memory_dataset() -> None:
 
     # create new replay memory dataset, according to the behaviour of the provided bots and the provided random seed
     engine = SchnapsenGamePlayEngine()
-    replay_memory_recording_bot_1 = MLDataBot(bot_1_behaviour, replay_memory_location=replay_memory_location)
-    replay_memory_recording_bot_2 = MLDataBot(bot_2_behaviour, replay_memory_location=replay_memory_location)
-    for i in range(1, num_of_games + 1):
-        if i % 500 == 0:
-            print(f"Progress: {i}/{num_of_games}")
-        engine.play_game(replay_memory_recording_bot_1, replay_memory_recording_bot_2, random.Random(i))
+    # both bots hand their records to the same writer, which appends them to the dataset in the background
+    with ReplayMemoryWriter(replay_memory_location) as writer:
+        replay_memory_recording_bot_1 = MLDataBot(bot_1_behaviour, replay_memory_location=replay_memory_location, writer=writer)
+        replay_memory_recording_bot_2 = MLDataBot(bot_2_behaviour, replay_memory_location=replay_memory_location, writer=writer)
+        # one generator for all games, reseeded with the number of each game, gives the same deals as a new random.Random(i) per game
+        game_rng = random.Random()
+        for i in range(1, num_of_games + 1):
+            if i % 500 == 0:
+                logger.info("Progress: %d/%d", i, num_of_games)
+            game_rng.seed(i)
+            engine.play_game(replay_memory_recording_bot_1, replay_memory_recording_bot_2, game_rng)
     print(f"Replay memory dataset recorder for {num_of_games} games.\nDataset is stored at: {replay_memory_location}")
 
 
 @ml.command()
 def train_model() -> None:
+    """
+    Train a model on a replay memory dataset.
+
+    Both formats of create-replay-memory-dataset are read: text lines, and the binary format of a replay_memory_filename ending in .f16.
+    """
     # directory where the replay memory is saved
     replay_memory_filename: str = 'RdeepBot_RdeepBot_10k_games_for_rollout.txt'
     # filename of replay memory within that directory
@@ -1,7 +1,10 @@
+import logging
+import multiprocessing as mp
+import os
 import random
 import pathlib
 
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
 from src.schnapsen.bots.rdeep_ML import RdeepMLBot
@@ -11,37 +14,100 @@ from src.schnapsen.game import (Bot, Move, PlayerPerspective,
                             SchnapsenGamePlayEngine, Trump_Exchange)
 from src.schnapsen.twenty_four_card_schnapsen import \
     TwentyFourSchnapsenGamePlayEngine
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from statsmodels.stats.proportion import proportions_ztest
+from scipy.special import ndtr
+
+logger = logging.getLogger(__name__)
+
+# The engine and bots of a worker process, created once by _init_worker and reused for every game the worker plays.
+# Instead of making new bots for every game, the random number generators of the bots are reseeded with the number of the game,
+# so the outcome of a game only depends on its number, not on which worker process plays it, or on what that worker played before.
+_engine: SchnapsenGamePlayEngine
+_rdeep_ML: RdeepMLBot
+_rdeep: RdeepBot
+_opponent: Bot
+_rdeep_rng = random.Random()
+# The random number generator of the games of a worker process, reseeded with the number of each game rather than recreated for it
+_game_rng = random.Random()
+# The seeds of the bots in the first game, every later game adds its number to them
+RDEEP_SEED = 4564654644
+OPPONENT_SEED = 464566
+
+
+def proportions_z(wins1: npt.ArrayLike, wins2: npt.ArrayLike, nobs1: npt.ArrayLike, nobs2: npt.ArrayLike) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    The two proportion z test with a pooled proportion, of whether the win rate of the first bot is larger than that of the second.
+    This gives the same as statsmodels' proportions_ztest(alternative="larger"), without its per call overhead.
+    All arguments can be arrays, to test a whole sweep of experiments in one call.
+
+    :returns: the z statistic and the p value
+    """
+    wins1, wins2 = np.asarray(wins1, dtype=np.float64), np.asarray(wins2, dtype=np.float64)
+    nobs1, nobs2 = np.asarray(nobs1, dtype=np.float64), np.asarray(nobs2, dtype=np.float64)
+    pooled = (wins1 + wins2) / (nobs1 + nobs2)
+    z = (wins1 / nobs1 - wins2 / nobs2) / np.sqrt(pooled * (1 - pooled) * (1 / nobs1 + 1 / nobs2))
+    return z, ndtr(-z)
+
+
+def _init_worker(bot: Bot, samples: int, depth: int) -> None:
+    """Create the engine and the rdeep bots, and receive the opponent, once per worker process rather than once per game."""
+    global _engine, _rdeep_ML, _rdeep, _opponent
+    _engine = SchnapsenGamePlayEngine()
+    # only one of the rdeep bots plays a game, so they can share their random number generator
+    _rdeep_ML = RdeepMLBot(num_samples=samples, depth=depth, rand=_rdeep_rng)
+    _rdeep = RdeepBot(num_samples=6, depth=6, rand=_rdeep_rng)
+    _opponent = bot
+
+
+def _reseed_bot(bot: Bot, seed: int) -> None:
+    """
+    Seed the random number generators the bot keeps in its attributes, also those of the bots it wraps.
+    The opponent is created by the caller, so its random number generator can only be found this way. Bots without one are left as they are.
+    """
+    for value in getattr(bot, "__dict__", {}).values():
+        if isinstance(value, random.Random):
+            value.seed(seed)
+        elif isinstance(value, Bot):
+            _reseed_bot(value, seed)
+
+
+def _play_one(game: Tuple[bool, int]) -> Tuple[bool, bool]:
+    """
+    Play a single game of the experiment with the bots of this worker process, seeded for this game.
+
+    :param game: whether the game is played by the RdeepMLBot (otherwise the RdeepBot), and the number of the game
+    :returns: whether the game was played by the RdeepMLBot, and whether that rdeep bot won
+    """
+    use_ML, game_number = game
+    rdeep: Bot = _rdeep_ML if use_ML else _rdeep
+    _rdeep_rng.seed(RDEEP_SEED + game_number)
+    _reseed_bot(_opponent, OPPONENT_SEED + game_number)
+    lead, follower = (_opponent, rdeep) if game_number % 2 == 0 else (rdeep, _opponent)
+    _game_rng.seed(game_number)
+    winner_id, _, _ = _engine.play_game(lead, follower, _game_rng)
+    return use_ML, winner_id is rdeep
+
 
 def prop_ztest(bot, amount, samples=6, depth=6):
-    bot1: Bot
-    bot2: Bot
-    engine = SchnapsenGamePlayEngine()
-    win_rdeepML = 0
-    win_rdeep = 0
-    for game_number in range(1, amount + 1):
-        #rdeep_ML = bot1 = RdeepMLBot(num_samples=samples, depth=depth, rand=random.Random(4564654644))
-        rdeep_ML = bot1 = RdeepMLBot(num_samples=samples, depth=depth, rand=random.Random(4564654644))
-        bot2 = bot
-        if game_number % 2 == 0:
-            bot1, bot2 = bot2, bot1
-        winner_id, _, _ = engine.play_game(bot1, bot2, random.Random(game_number))
-        if winner_id == rdeep_ML:
-            win_rdeepML += 1
-        if game_number % 50 == 0:
-            print(str(game_number) + " Game has finished")
-    for game_number in range(1, amount + 1):
-        #rdeep_ML = bot1 = RdeepMLBot(num_samples=samples, depth=depth, rand=random.Random(4564654644))
-        rdeep = bot1 = RdeepBot(num_samples=6, depth=6, rand=random.Random(4564654644))
-        bot2 = bot
-        if game_number % 2 == 0:
-            bot1, bot2 = bot2, bot1
-        winner_id, _, _ = engine.play_game(bot1, bot2, random.Random(game_number))
-        if winner_id == rdeep:
-            win_rdeep += 1
-        if game_number % 50 == 0:
-            print(str(game_number) + " Game has finished")
-    result, p_value = proportions_ztest([win_rdeepML,win_rdeep], [200,200], alternative = "larger")
+    """
+    Play amount games of both the RdeepMLBot and the RdeepBot against bot, and test whether the RdeepMLBot wins more often.
+    The progress is logged at INFO level, callers have to configure logging to see it, for example with logging.basicConfig(level=logging.INFO).
+
+    :returns: the z statistic, the p value, and the wins of the RdeepBot and of the RdeepMLBot
+    """
+    # both experiments play the same amount of games, all submitted to the same pool
+    wins = {True: 0, False: 0}
+    games = [(use_ML, game_number) for use_ML in (True, False) for game_number in range(1, amount + 1)]
+    with mp.Pool(processes=os.cpu_count(), initializer=_init_worker, initargs=(bot, samples, depth)) as pool:
+        for finished, (use_ML, rdeep_won) in enumerate(pool.imap_unordered(_play_one, games, chunksize=8), start=1):
+            if rdeep_won:
+                wins[use_ML] += 1
+            if finished % 50 == 0:
+                logger.info("%d Game has finished", finished)
+    win_rdeepML, win_rdeep = wins[True], wins[False]
+    z, p = proportions_z(win_rdeepML, win_rdeep, amount, amount)
+    result, p_value = float(z), float(p)
     return result, p_value, win_rdeep, win_rdeepML
     
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Helpers for the move selection of the rule based bots, BullyBot and SecondBot.
+These get called for every decision, so each move is decoded once into a plain tuple, the points of each rank are looked up once,
+and the scans over the moves are left to builtins.
+"""
+from random import Random
+from typing import Sequence, Tuple, TypeVar
+from src.schnapsen.game import Move, SchnapsenTrickScorer
+from src.schnapsen.deck import Rank, Suit
+
+RANK_POINTS: dict[Rank, int] = dict(SchnapsenTrickScorer.SCORES)
+"""The points of each rank in Schnapsen"""
+
+REGULAR_MOVE, MARRIAGE, TRUMP_EXCHANGE = 0, 1, 2
+"""The kinds of move in a MoveDescriptor"""
+
+MoveDescriptor = Tuple[int, Suit, Rank]
+"""The kind of a move, and the suit and rank of its first card (the queen for a marriage, the jack for a trump exchange)"""
+
+DecodedMove = Tuple[Move, MoveDescriptor]
+
+
+def decode(move: Move) -> MoveDescriptor:
+    """Get the descriptor of the move."""
+    if move.is_regular_move():
+        card = move.as_regular_move().card
+        return REGULAR_MOVE, card.suit, card.rank
+    if move.is_marriage():
+        card = move.as_marriage().queen_card
+        return MARRIAGE, card.suit, card.rank
+    card = move.as_trump_exchange().jack
+    return TRUMP_EXCHANGE, card.suit, card.rank
+
+
+def decode_moves(moves: Sequence[Move]) -> list[DecodedMove]:
+    """Pair each of the moves with its descriptor, keeping the order of the moves."""
+    return [(move, decode(move)) for move in moves]
+
+
+def _points(decoded_move: DecodedMove) -> int:
+    """
+    The points of a move are defined by the card played.
+    For a marriage, it is the queen, for a trump exchange it is 0, since no card is actually played.
+    """
+    kind, _, rank = decoded_move[1]
+    if kind == TRUMP_EXCHANGE:
+        return 0
+    return RANK_POINTS[rank]
+
+
+def highest_points_move(decoded_moves: Sequence[DecodedMove]) -> DecodedMove:
+    """Get the first of the moves with the highest points, with its descriptor. The moves must not be empty."""
+    return max(decoded_moves, key=_points)
+
+
+def lowest_points_move(decoded_moves: Sequence[DecodedMove]) -> DecodedMove:
+    """Get the last of the moves with the lowest points, with its descriptor. The moves must not be empty."""
+    return min(reversed(decoded_moves), key=_points)
+
+
+T = TypeVar("T", Move, DecodedMove)
+
+
+def pick(rng: Random, moves: Sequence[T]) -> T:
+    """
+    Pick one of the moves uniformly at random. The moves must not be empty.
+    When there is only one move, it is returned without drawing from rng.
+    """
+    if len(moves) == 1:
+        return moves[0]
+    return moves[rng.randrange(len(moves))]
@@ -1,11 +1,15 @@
-from src.schnapsen.game import Bot, PlayerPerspective, SchnapsenDeckGenerator, Move, Trick, GamePhase
-from typing import List, Optional, cast, Literal
+from src.schnapsen.game import Bot, PlayerPerspective, SchnapsenDeckGenerator, Move, Trick, ExchangeTrick, RegularTrick, GamePhase, _load_model
+from typing import List, Optional, Union, cast, Literal
 from src.schnapsen.deck import Suit, Rank
 from sklearn.neural_network import MLPClassifier
 from sklearn.linear_model import LogisticRegression
 import joblib
+import numpy as np
 import time
 import pathlib
+import os
+import queue
+import threading
 
 
 class MLPlayingBot(Bot):
@@ -22,8 +26,8 @@ class MLPlayingBot(Bot):
         if model_location is None:
             model_location = pathlib.Path("ML_models/") / "test_model"
         assert model_location.exists(), f"Model could not be found at: {model_location}"
-        # load model
-        self.__model = joblib.load(model_location)
+        # load model, only once per process, every bot playing with the same model shares it
+        self.__model = _load_model(str(model_location))
 
     def get_move(self, state: PlayerPerspective, leader_move: Optional[Move]) -> Move:
         # get the sate feature representation
@@ -32,38 +36,145 @@ class MLPlayingBot(Bot):
         leader_move_representation = get_move_feature_vector(leader_move)
         # get all my valid moves
         my_valid_moves = state.valid_moves()
-        # get the feature representations for all my valid moves
-        my_move_representations: list[list[int]] = []
-        for my_move in my_valid_moves:
-            my_move_representations.append(get_move_feature_vector(my_move))
-
-        # create all model inputs, for all bot's valid moves
-        action_state_representations: list[list[int]] = []
+        # the part of the model input which is the same for each of my moves
         cards_representation = available_card_feature_vector(state)
         if state.am_i_leader():
-            follower_move_representation = get_move_feature_vector(None)
-            for my_move_representation in my_move_representations:
-                action_state_representations.append(
-                    state_representation + my_move_representation + follower_move_representation + cards_representation)
+            prefix = state_representation
+            suffix = get_move_feature_vector(None) + cards_representation
         else:
-            for my_move_representation in my_move_representations:
-                action_state_representations.append(
-                    state_representation + leader_move_representation + my_move_representation + cards_representation)
+            prefix = state_representation + leader_move_representation
+            suffix = cards_representation
+        # create all model inputs, for all bot's valid moves, as the rows of one matrix, so the model is asked once for all of them
+        action_state_representations = np.array(
+            [prefix + get_move_feature_vector(my_move) + suffix for my_move in my_valid_moves], dtype=np.float64)
 
         model_output = self.__model.predict_proba(action_state_representations)
-        winning_probabilities_of_moves = []
-        for output in model_output:
-            winning_probabilities_of_moves += [output[1]]
-        highest_value: float = -1
-        best_move: Move
-        for index, value in enumerate(winning_probabilities_of_moves):
-            if value > highest_value:
-                highest_value = value
-                best_move = my_valid_moves[index]
-        assert best_move is not None
+        # the first of the moves with the highest winning probability
+        best_move = my_valid_moves[int(np.argmax(model_output[:, 1]))]
         return best_move
 
 
+BINARY_REPLAY_MEMORY_SUFFIX = ".f16"
+"""
+Replay memories stored in a file with this suffix are binary rather than text:
+a little endian uint32 with the number of columns, followed by the records as rows of float16 features with the won label as last column.
+Half precision keeps the points, one-hot encodings and label exact, and the card probabilities to about three digits,
+at two bytes per feature, about half of what the text takes.
+"""
+
+
+def _append_replay_memories(file_descriptor: int, replay_memories: Union[str, np.ndarray]) -> None:
+    """
+    Append the replay memories of one game to the open file, either as text lines or as binary float16 rows.
+    The column count heading a binary file is written along with the first rows.
+    Rows are only appended to a binary file which has the same column count, and which ends with a complete row, otherwise an Exception is raised.
+    The file must be opened for reading as well, and in append mode, so reading its heading does not move where the rows are written.
+    """
+    if isinstance(replay_memories, str):
+        data = replay_memories.encode()
+    else:
+        columns = replay_memories.shape[1]
+        data = replay_memories.astype("<f2").tobytes()
+        size = os.fstat(file_descriptor).st_size
+        if size == 0:
+            data = np.array([columns], dtype="<u4").tobytes() + data
+        else:
+            os.lseek(file_descriptor, 0, os.SEEK_SET)
+            heading = os.read(file_descriptor, 4)
+            file_columns = int(np.frombuffer(heading, dtype="<u4")[0]) if len(heading) == 4 else None
+            if file_columns != columns:
+                raise Exception(f"Cannot append rows of {columns} columns to the binary replay memory, which has {file_columns} columns. "
+                                "Use a new file for replay memories with other features.")
+            if (size - 4) % (2 * columns) != 0:
+                raise Exception(f"Cannot append to the binary replay memory, its {size} bytes do not end with a complete row of {columns} columns.")
+    # a single write per game, repeated only in case the system wrote part of it
+    view = memoryview(data)
+    while view:
+        view = view[os.write(file_descriptor, view):]
+
+
+def load_binary_replay_memory(replay_memory_location: pathlib.Path) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Map a binary replay memory file into memory, without parsing or copying it.
+
+    :returns: the features of the records, one row per record, and their won labels
+    """
+    columns = int(np.fromfile(replay_memory_location, dtype="<u4", count=1)[0])
+    records = np.memmap(replay_memory_location, dtype="<f2", mode="r", offset=4).reshape(-1, columns)
+    return records[:, :-1], records[:, -1].astype(np.int64)
+
+
+class ReplayMemoryWriter:
+    """
+    Appends the replay memories of finished games to the replay memory file from a background thread,
+    so the games being played do not wait for the disk.
+    MLDataBots recording into the same file should share one writer, which is used as a context manager:
+    when it exits, the replay memories still pending are written and the file is closed.
+    """
+
+    def __init__(self, replay_memory_location: pathlib.Path, max_pending: int = 1024) -> None:
+        """
+        :param replay_memory_location: the file the replay memory records are appended to
+        :param max_pending: how many games can wait to be written before the games being played are made to wait
+        """
+        self.replay_memory_file_path: pathlib.Path = replay_memory_location
+        self.__pending: queue.Queue[Union[str, np.ndarray, None]] = queue.Queue(maxsize=max_pending)
+        # the exception which stopped the background thread, if any, raised again in the thread using the writer
+        self.__error: Optional[BaseException] = None
+        self.__thread = threading.Thread(target=self.__write_pending, daemon=True)
+        self.__thread.start()
+
+    def append(self, replay_memories: Union[str, np.ndarray]) -> None:
+        """
+        Schedule the replay memories of one game, text lines or binary rows, to be appended to the file.
+        Raises an Exception if the writer is closed, or if writing failed, since then nothing takes the replay memories off the queue anymore.
+        """
+        if not self.__put(replay_memories):
+            self.__raise_error()
+            raise Exception(f"The ReplayMemoryWriter for {self.replay_memory_file_path} is closed, cannot append replay memories")
+
+    def close(self) -> None:
+        """
+        Write the replay memories still pending and stop the background thread.
+        Raises an Exception if writing the replay memories failed.
+        """
+        self.__put(None)
+        self.__thread.join()
+        self.__raise_error()
+
+    def __put(self, item: Union[str, np.ndarray, None]) -> bool:
+        """Put the item on the queue, waiting for room as long as the background thread runs. Returns whether the item was put."""
+        while self.__thread.is_alive():
+            try:
+                self.__pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def __raise_error(self) -> None:
+        if self.__error is not None:
+            raise Exception(f"Writing the replay memories to {self.replay_memory_file_path} failed") from self.__error
+
+    def __enter__(self) -> 'ReplayMemoryWriter':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __write_pending(self) -> None:
+        try:
+            file_descriptor = os.open(self.replay_memory_file_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                while (replay_memories := self.__pending.get()) is not None:
+                    _append_replay_memories(file_descriptor, replay_memories)
+            finally:
+                os.close(file_descriptor)
+        except BaseException as error:
+            # kept for append and close, an exception in this thread would otherwise only be printed
+            self.__error = error
+
+
 class MLDataBot(Bot):
     """
     This class is defined to allow the creation of a training schnapsen bot dataset, that allows us to train a Machine Learning (ML) Bot
@@ -75,14 +186,17 @@ class MLDataBot(Bot):
     This class only records the decisions and game outcomes of the provided bot, according to its own perspective - incomplete game state knowledge.
     """
 
-    def __init__(self, bot: Bot, replay_memory_location: pathlib.Path) -> None:
+    def __init__(self, bot: Bot, replay_memory_location: pathlib.Path, writer: Optional[ReplayMemoryWriter] = None) -> None:
         """
         :param bot: the provided bot that will actually play the game and make decisions
-        :param replay_memory_location: the filename under which the replay memory records will be
+        :param replay_memory_location: the filename under which the replay memory records will be.
+            If it has the BINARY_REPLAY_MEMORY_SUFFIX the records are stored as binary float16 rows, otherwise as text lines.
+        :param writer: if given, the records of each game are handed to this writer for the same file, rather than written before the next game starts
         """
 
         self.bot: Bot = bot
         self.replay_memory_file_path: pathlib.Path = replay_memory_location
+        self.writer: Optional[ReplayMemoryWriter] = writer
 
     def get_move(self, state: PlayerPerspective, leader_move: Optional[Move]) -> Move:
         """
@@ -103,16 +217,21 @@ class MLDataBot(Bot):
         game_history: list[tuple[PlayerPerspective, Trick]] = cast(list[tuple[PlayerPerspective, Trick]], state.get_game_history()[:-1])
         # we also save the training label "won or lost"
         won_label = won
+        # the records of all rounds, written at once when the game has been gone through
+        binary = self.replay_memory_file_path.suffix == BINARY_REPLAY_MEMORY_SUFFIX
+        replay_memory_rows: list[list[float]] = []
+        replay_memory_lines: list[str] = []
 
         # we iterate over all the rounds of the game
         for round_player_perspective, round_trick in game_history:
 
             if round_trick.is_trump_exchange():
-                leader_move = round_trick.exchange
+                leader_move: Move = cast(ExchangeTrick, round_trick).exchange
                 follower_move = None
             else:
-                leader_move = round_trick.leader_move
-                follower_move = round_trick.follower_move
+                regular_trick = cast(RegularTrick, round_trick)
+                leader_move = regular_trick.leader_move
+                follower_move = regular_trick.follower_move
 
             # we do not want this representation to include actions that followed. So if this agent was the leader, we ignore the followers move
             if round_player_perspective.am_i_leader():
@@ -121,11 +240,26 @@ class MLDataBot(Bot):
             state_actions_representation = create_state_and_actions_vector_representation(
                 state=round_player_perspective, leader_move=leader_move, follower_move=follower_move)
 
-            # append replay memory to file
-            with open(file=self.replay_memory_file_path, mode="a") as replay_memory_file:
+            if binary:
+                # a binary row holds the features followed by the won label
+                replay_memory_rows.append(state_actions_representation + [int(won_label)])
+            else:
                 # replay_memory_line: List[Tuple[list, number]] = [state_actions_representation, won_label]
                 # writing to replay memory file in the form "[feature list] || int(won_label)]
-                replay_memory_file.write(f"{str(state_actions_representation)[1:-1]} || {int(won_label)}\n")
+                replay_memory_lines.append(f"{str(state_actions_representation)[1:-1]} || {int(won_label)}\n")
+
+        if binary and not replay_memory_rows:
+            return
+        # append replay memory to file
+        replay_memories: Union[str, np.ndarray] = np.array(replay_memory_rows, dtype=np.float16) if binary else "".join(replay_memory_lines)
+        if self.writer is not None:
+            self.writer.append(replay_memories)
+        else:
+            file_descriptor = os.open(self.replay_memory_file_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                _append_replay_memories(file_descriptor, replay_memories)
+            finally:
+                os.close(file_descriptor)
 
 
 def train_ML_model(replay_memory_location: Optional[pathlib.Path],
@@ -160,19 +294,24 @@ def train_ML_model(replay_memory_location: Optional[pathlib.Path],
     # check if directory exists, and if not, then create it
     model_location.parent.mkdir(parents=True, exist_ok=True)
 
-    data: list[list[int]] = []
-    targets: list[int] = []
-    with open(file=replay_memory_location, mode="r") as replay_memory_file:
-        for line in replay_memory_file:
-            feature_string, won_label_str = line.split("||")
-            feature_list_strings: list[str] = feature_string.split(",")
-            feature_list = [float(feature) for feature in feature_list_strings]
-            won_label = int(won_label_str)
-            data.append(feature_list)
-            targets.append(won_label)
+    data: Union[list[list[float]], np.ndarray]
+    targets: Union[list[int], np.ndarray]
+    if replay_memory_location.suffix == BINARY_REPLAY_MEMORY_SUFFIX:
+        # the binary records are used as they are on disk
+        data, targets = load_binary_replay_memory(replay_memory_location)
+    else:
+        data, targets = [], []
+        with open(file=replay_memory_location, mode="r") as replay_memory_file:
+            for line in replay_memory_file:
+                feature_string, won_label_str = line.split("||")
+                feature_list_strings: list[str] = feature_string.split(",")
+                feature_list = [float(feature) for feature in feature_list_strings]
+                won_label = int(won_label_str)
+                data.append(feature_list)
+                targets.append(won_label)
 
     print("Dataset Statistics:")
-    samples_of_wins = sum(targets)
+    samples_of_wins = int(np.sum(targets))
     samples_of_losses = len(targets) - samples_of_wins
     print("Samples of wins:", samples_of_wins)
     print("Samples of losses:", samples_of_losses)
@@ -224,6 +363,8 @@ def train_ML_model(replay_memory_location: Optional[pathlib.Path],
     model = learner.fit(data, targets)
     # Save the model in a file
     joblib.dump(model, model_location)
+    # a model loaded before in this process may have been replaced, the bots created from now on load the new one
+    _load_model.cache_clear()
     end = time.time()
     print('The model was trained in ', (end - start) / 60, 'minutes.')
 
@@ -314,15 +455,15 @@ def get_move_feature_vector(move: Optional[Move]) -> List[int]:
         # in case the move is a marriage move
         if move.is_marriage():
             move_type_one_hot_encoding = [0, 0, 1]
-            card = move.queen_card
+            card = move.as_marriage().queen_card
         #  in case the move is a trump exchange move
         elif move.is_trump_exchange():
             move_type_one_hot_encoding = [0, 1, 0]
-            card = move.jack
+            card = move.as_trump_exchange().jack
         #  in case it is a regular move
         else:
             move_type_one_hot_encoding = [1, 0, 0]
-            card = move.card
+            card = move.as_regular_move().card
         move_type_one_hot_encoding_numpy_array = move_type_one_hot_encoding
         card_rank_one_hot_encoding_numpy_array = get_one_hot_encoding_of_card_rank(card.rank)
         card_suit_one_hot_encoding_numpy_array = get_one_hot_encoding_of_card_suit(card.suit)
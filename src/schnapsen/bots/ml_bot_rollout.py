@@ -1,4 +1,4 @@
-from src.schnapsen.game import Bot, PlayerPerspective, SchnapsenDeckGenerator, Move, Trick, GamePhase
+from src.schnapsen.game import Bot, PlayerPerspective, SchnapsenDeckGenerator, Move, Trick, ExchangeTrick, RegularTrick, GamePhase
 from typing import List, Optional, cast, Literal
 from src.schnapsen.deck import Suit, Rank
 from sklearn.neural_network import MLPClassifier
@@ -104,11 +104,12 @@ class MLDataBot(Bot):
         for round_player_perspective, round_trick in game_history:
 
             if round_trick.is_trump_exchange():
-                leader_move = round_trick.exchange
+                leader_move: Move = cast(ExchangeTrick, round_trick).exchange
                 follower_move = None
             else:
-                leader_move = round_trick.leader_move
-                follower_move = round_trick.follower_move
+                regular_trick = cast(RegularTrick, round_trick)
+                leader_move = regular_trick.leader_move
+                follower_move = regular_trick.follower_move
 
             # we do not want this representation to include actions that followed. So if this agent was the leader, we ignore the followers move
             if round_player_perspective.am_i_leader():
@@ -305,15 +306,15 @@ def get_move_feature_vector(move: Optional[Move]) -> List[int]:
         # in case the move is a marriage move
         if move.is_marriage():
             move_type_one_hot_encoding = [0, 0, 1]
-            card = move.queen_card
+            card = move.as_marriage().queen_card
         #  in case the move is a trump exchange move
         elif move.is_trump_exchange():
             move_type_one_hot_encoding = [0, 1, 0]
-            card = move.jack
+            card = move.as_trump_exchange().jack
         #  in case it is a regular move
         else:
             move_type_one_hot_encoding = [1, 0, 0]
-            card = move.card
+            card = move.as_regular_move().card
         move_type_one_hot_encoding_numpy_array = move_type_one_hot_encoding
         card_rank_one_hot_encoding_numpy_array = get_one_hot_encoding_of_card_rank(card.rank)
         card_suit_one_hot_encoding_numpy_array = get_one_hot_encoding_of_card_suit(card.suit)
@@ -1,11 +1,14 @@
 import random
-from typing import Optional
+from typing import Optional, Union
 from src.schnapsen.game import Bot, PlayerPerspective, Move
 
 
 class RandBot(Bot):
-    def __init__(self, rand: random.Random) -> None:
-        self.rng = rand
+    def __init__(self, rand: Union[random.Random, int]) -> None:
+        """
+        :param rand: the random number generator used to choose the moves, or the seed to create one with
+        """
+        self.rng = rand if isinstance(rand, random.Random) else random.Random(rand)
 
     def get_move(
         self,
@@ -13,7 +16,7 @@ class RandBot(Bot):
         leader_move: Optional[Move],
     ) -> Move:
         moves: list[Move] = state.valid_moves()
-        move = self.rng.choice(list(moves))
+        move = self.rng.choice(moves)
         return move
 
     def __repr__(self) -> str:
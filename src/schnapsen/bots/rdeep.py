@@ -1,6 +1,7 @@
 from typing import Optional
 from src.schnapsen.game import Bot, PlayerPerspective, Move, GameState, GamePlayEngine
 from random import Random
+import numpy as np
 
 
 class RdeepBot(Bot):
@@ -19,35 +20,28 @@ class RdeepBot(Bot):
         self.__rand = rand
         self.count = []
     def get_move(self, state: PlayerPerspective, leader_move: Optional[Move]) -> Move:
-        # get the list of valid moves, and shuffle it such
-        # that we get a random move of the highest scoring
-        # ones if there are multiple highest scoring moves.
+        # get the list of valid moves, and the average score of each of them
         moves = state.valid_moves()
-        self.__rand.shuffle(moves)
-
-        best_score = float('-inf')
-        best_move = None
-        moves_count = 0
-        for move in moves:
+        # the rollouts only play valid moves, so the engine does not need to check them
+        engine = state.get_engine().without_move_validation()
+        scores = np.empty(len(moves), dtype=np.float64)
+        # the share of the opponent hand each sample guessed right, NaN for the samples of phase two, which know the opponent hand
+        counts = np.full((len(moves), self.__num_samples), np.nan)
+        for move_index, move in enumerate(moves):
             sum_of_scores = 0.0
-            total_count = 0
-            for _ in range(self.__num_samples):
+            for sample_index in range(self.__num_samples):
                 gamestate, count = state.make_assumption(leader_move=leader_move, rand=self.__rand)
                 if count is not None:
-                    total_count += count
-                score = self.__evaluate(gamestate, state.get_engine(), leader_move, move)
+                    counts[move_index, sample_index] = count
+                score = self.__evaluate(gamestate, engine, leader_move, move)
                 sum_of_scores += score
-            if count is not None:
-                total_count = total_count/self.__num_samples
-                moves_count += total_count
-            average_score = sum_of_scores / self.__num_samples
-            if average_score > best_score:
-                best_score = average_score
-                best_move = move
-            
-        assert best_move is not None
-        if count is not None:
-            self.count += [moves_count/len(moves)]
+            scores[move_index] = sum_of_scores / self.__num_samples
+        # we get a random move of the highest scoring ones if there are multiple highest scoring moves.
+        best_indices = np.flatnonzero(scores == scores.max())
+        best_index = best_indices[0] if len(best_indices) == 1 else self.__rand.choice(best_indices)
+        best_move = moves[int(best_index)]
+        if not np.isnan(counts).all():
+            self.count.append(float(np.nanmean(counts)))
         return best_move
 
     def __evaluate(self, gamestate: GameState, engine: GamePlayEngine, leader_move: Optional[Move], my_move: Move) -> float:
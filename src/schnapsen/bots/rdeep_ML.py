@@ -1,14 +1,40 @@
 import pathlib
+import functools
 from typing import Optional, cast
-from src.schnapsen.game import Bot, PlayerPerspective, Move, GameState, GamePlayEngine, Trick
+from src.schnapsen.game import Bot, PlayerPerspective, Move, GameState, GamePlayEngine, ExchangeTrick, RegularTrick, _load_model
+from src.schnapsen.deck import Card
 from random import Random
 from src.schnapsen.bots import MLPlayingBot, RdeepBot, RandBot
 from src.schnapsen.bots.bot2 import SecondBot
 from src.schnapsen.bots.bully import BullyBot
-import joblib
 import numpy as np
 
+KNN_MODEL_PATH = pathlib.Path("ML_models/KNN_model")
+"""The model predicting which bot the opponent is, from the states and moves of the game so far"""
+NEW_RDEEP_MODEL_PATH = pathlib.Path("ML_models/New_Rdeep_model")
+"""The model this bot plays with in its rollouts"""
+OPPONENT_MODEL_PATHS: dict[int, pathlib.Path] = {
+    0: pathlib.Path("ML_models/random_model"),
+    1: pathlib.Path("ML_models/bully_model"),
+    2: NEW_RDEEP_MODEL_PATH,
+    3: pathlib.Path("ML_models/2ndBot_model"),
+}
+"""The model which plays like each of the opponents the KNN model predicts"""
+
+
+@functools.lru_cache(maxsize=None)
+def _playing_bot(model_path: pathlib.Path) -> MLPlayingBot:
+    """The MLPlayingBot playing with the model at model_path. It keeps no state, so one is shared by all rollouts in this process."""
+    return MLPlayingBot(model_path)
+
+
 class RdeepMLBot(Bot):
+    CACHE_TALON_SCORES = True
+    """
+    Whether the score of a talon order is played out once per move and reused when the order comes up again, against an ML opponent.
+    The rollouts against an ML opponent are deterministic, so this gives the same scores, and the same moves, as playing out every sample.
+    """
+
     def __init__(self, num_samples: int, depth: int, rand: Random) -> None:
         """
         Create a new rdeep bot.
@@ -25,38 +51,55 @@ class RdeepMLBot(Bot):
         self.previous_state = []
         self.count = []
         self.KNN_count = [0,0,0,0]
+        # how often the KNN model predicted each opponent for the states in previous_state, so only the newest state needs predicting.
+        # This is the bincount of all predictions, kept up to date one prediction at a time; its argmax is the majority vote.
+        self.__prediction_counts = np.zeros(len(OPPONENT_MODEL_PATHS), dtype=np.int64)
     def get_move(self, state: PlayerPerspective, leader_move: Optional[Move]) -> Move:
-        # get the list of valid moves, and shuffle it such
-        # that we get a random move of the highest scoring
-        # ones if there are multiple highest scoring moves.
+        # get the list of valid moves, and the average score of each of them
         moves = state.valid_moves()
-        self.__rand.shuffle(moves)
-        best_score = float('-inf')
-        best_move = None
+        # the opponent is still predicted on a forced move, since every trick of the game is one vote in that prediction
         model_path = self.predict_opponent(state)
-        moves_count = 0
-        for move in moves:
+        if len(moves) == 1:
+            return moves[0]
+        # the rollouts only play valid moves, so the engine does not need to check them
+        engine = state.get_engine().without_move_validation()
+        scores = np.empty(len(moves), dtype=np.float64)
+        # the share of the opponent hand each sample guessed right, NaN for the samples of phase two, which know the opponent hand
+        counts = np.full((len(moves), self.__num_samples), np.nan)
+        for move_index, move in enumerate(moves):
             sum_of_scores = 0.0
-            total_count = 0
-            for _ in range(self.__num_samples):
+            # Against an ML opponent the rollouts are deterministic, and the assumptions for a move only differ in the order of the talon.
+            # So the score of each talon order is only played out once; with few unseen cards left, the same order comes up often.
+            # Against the random opponent (before the opponent can be predicted) every rollout is played.
+            scores_per_talon: Optional[dict[tuple[Card, ...], float]] = {} if model_path is not None and self.CACHE_TALON_SCORES else None
+            # The samples are evaluated one after the other. The experiments already play their games on all cores,
+            # (see binomial_experiment.py and proportion_ztest.py), and their pool workers cannot start processes of their own.
+            # Spreading the samples over processes would also make the rollouts draw from other sources of randomness than self.__rand.
+            for sample_index in range(self.__num_samples):
                 gamestate, count = state.make_assumption_ML(leader_move=leader_move, rand=self.__rand, my_move=move)
                 if count is not None:
-                    total_count += count
-                score = self.__evaluate(model_path, gamestate, state.get_engine(), leader_move, move)
+                    counts[move_index, sample_index] = count
+                if scores_per_talon is None:
+                    score = self.__evaluate(model_path, gamestate, engine, leader_move, move)
+                else:
+                    talon_order = tuple(gamestate.talon.get_cards())
+                    cached_score = scores_per_talon.get(talon_order)
+                    if cached_score is None:
+                        score = self.__evaluate(model_path, gamestate, engine, leader_move, move)
+                        scores_per_talon[talon_order] = score
+                    else:
+                        score = cached_score
                 sum_of_scores += score
-            if count is not None:
-                total_count = total_count/self.__num_samples
-                moves_count += total_count
-            average_score = sum_of_scores / self.__num_samples
-            if average_score > best_score:
-                best_score = average_score
-                best_move = move
-        assert best_move is not None
-        if count is not None:
-            self.count += [moves_count/len(moves)]
+            scores[move_index] = sum_of_scores / self.__num_samples
+        # we get a random move of the highest scoring ones if there are multiple highest scoring moves.
+        best_indices = np.flatnonzero(scores == scores.max())
+        best_index = best_indices[0] if len(best_indices) == 1 else self.__rand.choice(best_indices)
+        best_move = moves[int(best_index)]
+        if not np.isnan(counts).all():
+            self.count.append(float(np.nanmean(counts)))
         return best_move
 
-    def __evaluate(self, model_path, gamestate: GameState, engine: GamePlayEngine, leader_move: Optional[Move], my_move: Move) -> float:
+    def __evaluate(self, model_path: Optional[pathlib.Path], gamestate: GameState, engine: GamePlayEngine, leader_move: Optional[Move], my_move: Move) -> float:
         """
         Evaluates the value of the given state for the given player
         :param state: The state to evaluate
@@ -70,15 +113,15 @@ class RdeepMLBot(Bot):
         if model_path is None:
             oppoenet = RandBot(rand=self.__rand)
         else:
-            oppoenet = MLPlayingBot(pathlib.Path(model_path))
+            oppoenet = _playing_bot(model_path)
         if leader_move:
             # we know what the other bot played
             leader_bot = FirstFixedMoveThenBaseBot(oppoenet, leader_move)
             # I am the follower
-            me = follower_bot = FirstFixedMoveThenBaseBot(MLPlayingBot(pathlib.Path("ML_models/New_Rdeep_model")), my_move)
+            me = follower_bot = FirstFixedMoveThenBaseBot(_playing_bot(NEW_RDEEP_MODEL_PATH), my_move)
         else:
             # I am the leader bot
-            me = leader_bot = FirstFixedMoveThenBaseBot(MLPlayingBot(pathlib.Path("ML_models/New_Rdeep_model")), my_move)
+            me = leader_bot = FirstFixedMoveThenBaseBot(_playing_bot(NEW_RDEEP_MODEL_PATH), my_move)
             # We assume the other bot just random
             follower_bot = oppoenet
 
@@ -91,38 +134,48 @@ class RdeepMLBot(Bot):
             my_score = new_game_state.follower.score.direct_points
             opponent_score = new_game_state.leader.score.direct_points
 
-        heuristic = my_score / (my_score + opponent_score)
+        # neither player may have scored yet after a short rollout, which counts as even
+        total_score = my_score + opponent_score
+        heuristic = my_score / total_score if total_score > 0 else 0.5
         return heuristic
 
-    def predict_opponent(self, state: PlayerPerspective):
-        game_history: list[tuple[PlayerPerspective, Trick]] = cast(list[tuple[PlayerPerspective, Trick]], state.get_game_history())
+    def notify_game_end(self, won: bool, state: PlayerPerspective) -> None:
+        # The opponent is predicted from the states of one game, so the next game starts without them.
+        # KNN_count and count are kept, they are the statistics of all games this bot played.
+        self.previous_state = []
+        self.__prediction_counts[:] = 0
+
+    def predict_opponent(self, state: PlayerPerspective) -> Optional[pathlib.Path]:
+        # only the last history record has no Trick, and that is not the one used
+        game_history = state.get_game_history()
         if len(game_history) > 1:
-            prev = game_history[-2]
-            round_player_perspective, round_trick = prev
+            round_player_perspective, round_trick = game_history[-2]
+            assert round_trick is not None
             if round_trick.is_trump_exchange():
-                leader_move = round_trick.exchange
+                leader_move: Move = cast(ExchangeTrick, round_trick).exchange
                 follower_move = None
             else:
-                leader_move = round_trick.leader_move
-                follower_move = round_trick.follower_move
+                regular_trick = cast(RegularTrick, round_trick)
+                leader_move = regular_trick.leader_move
+                follower_move = regular_trick.follower_move
             # we do not want this representation to include actions that followed. So if this agent was the leader, we ignore the followers move
             if round_player_perspective.am_i_leader():
                 follower_move = None
             state_actions_representation = state.create_state_and_actions_vector_representation(
                 state=round_player_perspective, leader_move=leader_move, follower_move=follower_move)
-            self.previous_state += [state_actions_representation]
-            model = joblib.load("ML_models/KNN_model")
-            pred = list(model.predict(self.previous_state))
-            index = max(set(pred), key = pred.count)
+            features = np.asarray(state_actions_representation, dtype=np.float64).reshape(1, -1)
+            # The history is kept in half precision, as in the binary replay memories: the counts and one-hot features stay exact,
+            # only the card probabilities are rounded. The features are not quantized to int8, since those probabilities would all become 0.
+            self.previous_state.append(features[0].astype(np.float16))
+            # the KNN model is loaded from disk once per process, on first use
+            model = _load_model(str(KNN_MODEL_PATH))
+            # the prediction itself is made on the exact features
+            new_prediction = int(model.predict(features)[0])
+            self.__prediction_counts[new_prediction] += 1
+            # the most predicted opponent so far, the lowest index on a tie
+            index = int(self.__prediction_counts.argmax())
             self.KNN_count[index] += 1
-            if index == 0:
-                model_path = "ML_models/random_model"
-            elif index == 1:
-                model_path = "ML_models/bully_model"
-            elif index == 2:
-                model_path = "ML_models/New_Rdeep_model"
-            elif index == 3:
-                model_path = "ML_models/2ndBot_model"
+            model_path = OPPONENT_MODEL_PATHS[index]
         else:
             model_path = None
         return model_path
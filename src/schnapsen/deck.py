@@ -11,6 +11,9 @@ class Suit(Enum):
     SPADES = auto()
     DIAMONDS = auto()
 
+    # members are singletons compared by identity, so they can be hashed by identity, in C, instead of by Enum.__hash__ on the name
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
         return self.name
 
@@ -30,6 +33,9 @@ class Rank(Enum):
     QUEEN = auto()
     KING = auto()
 
+    # see Suit.__hash__
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
         return self.name
 
@@ -97,6 +103,9 @@ class Card(Enum):
         self.suit = suit
         self.character = character
 
+    # Cards are kept in sets and used as keys in dicts all over the engine and the bots; see Suit.__hash__
+    __hash__ = object.__hash__
+
     @staticmethod
     def _get_card(rank: Rank, suit: Suit) -> 'Card':
         for card in Card:
@@ -117,6 +126,28 @@ class _CardCache:
     _CARD_CACHE = {(card_rank, card_suit): Card._get_card(card_rank, card_suit) for (card_rank, card_suit) in itertools.product(Rank, Suit)}
 
 
+CARD_BIT: dict[Card, int] = {card: 1 << index for index, card in enumerate(Card)}
+"""A distinct bit for each card, so a set of cards can be kept as the bitwise or of the bits of its cards (a bitboard)"""
+
+SUIT_MASK: dict[Suit, int] = {suit: sum(bit for card, bit in CARD_BIT.items() if card.suit is suit) for suit in Suit}
+"""The bitboard of all cards of each suit"""
+
+RANK_MASK: dict[Rank, int] = {rank: sum(bit for card, bit in CARD_BIT.items() if card.rank is rank) for rank in Rank}
+"""The bitboard of all cards of each rank"""
+
+_CARD_BY_INDEX: list[Card] = list(Card)
+
+
+def bitboard_cards(bitboard: int) -> list[Card]:
+    """Get the cards in the bitboard, in the order in which they are defined in Card"""
+    cards = []
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        cards.append(_CARD_BY_INDEX[lowest_bit.bit_length() - 1])
+        bitboard ^= lowest_bit
+    return cards
+
+
 class CardCollection(ABC):
     """A collection of cards for which the order is not significant and not guaranteed."""
 
@@ -129,12 +160,12 @@ class CardCollection(ABC):
 
     def filter_suit(self, suit: Suit) -> Iterable[Card]:
         """Returns an Iterable with in it all cards which have the provided suit"""
-        results: list[Card] = list(filter(lambda x: x.suit is suit, self.get_cards()))
+        results: list[Card] = [card for card in self.get_cards() if card.suit is suit]
         return results
 
     def filter_rank(self, rank: Rank) -> Iterable[Card]:
         """Returns an Iterable with in it all cards which have the provided rank"""
-        results: list[Card] = list(filter(lambda x: x.rank is rank, self.get_cards()))
+        results: list[Card] = [card for card in self.get_cards() if card.rank is rank]
         return results
 
     @abstractmethod
@@ -161,6 +192,16 @@ class OrderedCardCollection(CardCollection):
         """
         self._cards: list[Card] = list(cards or [])
 
+    @staticmethod
+    def view(cards: list[Card]) -> 'OrderedCardCollection':
+        """
+        Create an ordered collection which uses the given list as is, without the defensive copy of the constructor.
+        The collection itself never changes the list, so this is only safe as long as nobody else changes it either.
+        """
+        collection = OrderedCardCollection.__new__(OrderedCardCollection)
+        collection._cards = cards
+        return collection
+
     def is_empty(self) -> bool:
         return len(self._cards) == 0
 
@@ -8,11 +8,29 @@ from enum import Enum
 import pathlib
 from random import Random
 from typing import Iterable, Optional, Tuple, Union, List, cast, Any
-from .deck import CardCollection, OrderedCardCollection, Card, Rank, Suit
-import itertools
+from .deck import CardCollection, OrderedCardCollection, Card, Rank, Suit, CARD_BIT, SUIT_MASK, RANK_MASK, bitboard_cards
+import copy
+import functools
+import sys
 import joblib
 import numpy as np
 
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""
+Arguments for the dataclass decorator of the small classes of which several are made every trick, so they do not get a __dict__.
+dataclass only supports slots from python 3.10 on, on older versions they keep their __dict__.
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _load_model(model_location: str) -> Any:
+    """
+    Load the model stored at model_location, only the first time it is asked for in this process.
+    The models are only used for predictions, so the same object can be shared by all assumptions made.
+    """
+    return joblib.load(model_location)
+
+
 class Bot(ABC):
     """
     The Bot baseclass. Derive your own bots from this class and implement the get_move method to use it in games.
@@ -47,7 +65,7 @@ class Move(ABC):
     A single move during a game. There are several types of move possible: normal moves, trump exchanges, and marriages. They are implmented in classes inheriting from this class.
     """
 
-    cards: list[Card]  # implementation detail: The creation of this list is defered to the derived classes in _cards()
+    cards: tuple[Card, ...]  # implementation detail: This tuple is created once, by the derived classes in __post_init__
     """The cards played in this move"""
 
     def is_regular_move(self) -> bool:
@@ -86,18 +104,6 @@ class Move(ABC):
         """Returns this same move but as a Trump_Exchange."""
         raise AssertionError("as_marriage called on a Move which is not a Trump_Exchange. Check with is_trump_exchange first.")
 
-    def __getattribute__(self, __name: str) -> Any:
-        if __name == "cards":
-            # We call the method to compute the card list
-            return object.__getattribute__(self, "_cards")()
-        return object.__getattribute__(self, __name)
-
-    @abstractmethod
-    def _cards(self) -> list[Card]:
-        """
-        Get the list of cards in this move. This method should not be called direcly, use the cards property instead.
-        """
-
 
 @dataclass(frozen=True)
 class Trump_Exchange(Move):
@@ -105,9 +111,12 @@ class Trump_Exchange(Move):
 
     jack: Card
     """The Jack which will be placed at the bottom of the Talon"""
+    cards: tuple[Card, ...] = field(init=False, repr=False, compare=False)
+    """The cards played in this move, gets derived from the jack."""
 
     def __post_init__(self) -> None:
         assert self.jack.rank is Rank.JACK
+        object.__setattr__(self, "cards", (self.jack,))
 
     def is_trump_exchange(self) -> bool:
         return True
@@ -115,9 +124,6 @@ class Trump_Exchange(Move):
     def as_trump_exchange(self) -> 'Trump_Exchange':
         return self
 
-    def _cards(self) -> list[Card]:
-        return [self.jack]
-
     def __repr__(self) -> str:
         return f"Trump_Exchange(jack={self.jack})"
 
@@ -128,9 +134,11 @@ class RegularMove(Move):
 
     card: Card
     """The card which is played"""
+    cards: tuple[Card, ...] = field(init=False, repr=False, compare=False)
+    """The cards played in this move, gets derived from the card."""
 
-    def _cards(self) -> list[Card]:
-        return [self.card]
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cards", (self.card,))
 
     @staticmethod
     def from_cards(cards: Iterable[Card]) -> list[Move]:
@@ -161,16 +169,22 @@ class Marriage(Move):
     """The king card of this marriage"""
     suit: Suit = field(init=False, repr=False, hash=False)
     """The suit of this marriage, gets derived from the suit of the queen and king."""
+    cards: tuple[Card, ...] = field(init=False, repr=False, compare=False)
+    """The cards played in this move, gets derived from the queen and king."""
+    _regular_move: RegularMove = field(init=False, repr=False, compare=False)
+    """The underlying regular move, made once, since both playing and scoring the trick ask for it."""
 
     def __post_init__(self) -> None:
         """
         Make sure that the suits of the fields all have the same suit and are a king and a queen.
-        Finally, sets the suit field.
+        Finally, sets the suit, cards and underlying regular move fields.
         """
         assert self.queen_card.rank is Rank.QUEEN
         assert self.king_card.rank is Rank.KING
         assert self.queen_card.suit == self.king_card.suit
         object.__setattr__(self, "suit", self.queen_card.suit)
+        object.__setattr__(self, "cards", (self.queen_card, self.king_card))
+        object.__setattr__(self, "_regular_move", RegularMove(self.queen_card))
 
     def is_marriage(self) -> bool:
         return True
@@ -184,17 +198,22 @@ class Marriage(Move):
         """
         # this limits you to only have the queen to play after a marriage, while in general you would have a choice.
         # This is not an issue since playing the queen give you the highest score.
-        return RegularMove(self.queen_card)
-
-    def _cards(self) -> list[Card]:
-        return [self.queen_card, self.king_card]
+        return self._regular_move
 
     def __repr__(self) -> str:
         return f"Marriage(queen_card={self.queen_card}, king_card={self.king_card})"
 
 
 class Hand(CardCollection):
-    """Representing the cards in the hand of a player. These are the cards which the player can see and which he can play with in the turn."""
+    """
+    Representing the cards in the hand of a player. These are the cards which the player can see and which he can play with in the turn.
+
+    Next to the list of cards, which keeps the order in which they were added, the hand keeps a bitboard of its cards (see deck.CARD_BIT),
+    so that membership tests and checks for a suit or rank do not have to go over the cards.
+    The cards can only be changed with remove and add, which keep the two the same.
+    A copy shares the list of cards with the original, until one of them is changed (copy on write).
+    Because of this, the list is kept private, and the cards property hands out a copy of it.
+    """
 
     def __init__(self, cards: Iterable[Card], max_size: int = 5) -> None:
         """
@@ -206,14 +225,25 @@ class Hand(CardCollection):
         self.max_size = max_size
         cards = list(cards)
         assert len(cards) <= max_size, f"The number of cards {len(cards)} is larger than the maximum number fo allowed cards {max_size}"
-        self.cards = cards
+        self._cards = cards
+        bitboard = 0
+        for card in cards:
+            bitboard |= CARD_BIT[card]
+        self._bitboard = bitboard
+        # whether the list of cards is shared with a copy, and must be copied before it is changed
+        self._shared = False
 
     def remove(self, card: Card) -> None:
         """Remove one occurence of the card from this hand"""
+        if self._shared:
+            self._cards = list(self._cards)
+            self._shared = False
         try:
-            self.cards.remove(card)
+            self._cards.remove(card)
         except ValueError as ve:
-            raise Exception(f"Trying to remove a card from the hand which is not in the hand. Hand is {self.cards}, trying to remove {card}") from ve
+            raise Exception(f"Trying to remove a card from the hand which is not in the hand. Hand is {self._cards}, trying to remove {card}") from ve
+        if card not in self._cards:
+            self._bitboard &= ~CARD_BIT[card]
 
     def add(self, card: Card) -> None:
         """
@@ -221,8 +251,22 @@ class Hand(CardCollection):
 
         :param card:  The card to be added to the hand
         """
-        assert len(self.cards) < self.max_size, "Adding one more card to the hand will cause a hand with too many cards"
-        self.cards.append(card)
+        assert len(self._cards) < self.max_size, "Adding one more card to the hand will cause a hand with too many cards"
+        if self._shared:
+            self._cards = list(self._cards)
+            self._shared = False
+        self._cards.append(card)
+        self._bitboard |= CARD_BIT[card]
+
+    @property
+    def cards(self) -> list[Card]:
+        """The cards in this hand, in the order in which they were added. This is a copy, changing it does not change the hand."""
+        return list(self._cards)
+
+    @property
+    def bitboard(self) -> int:
+        """The cards in this hand as a bitboard (see deck.CARD_BIT). It is read only, the cards are changed with remove and add."""
+        return self._bitboard
 
     def has_cards(self, cards: Iterable[Card]) -> bool:
         """
@@ -231,7 +275,10 @@ class Hand(CardCollection):
         :param cards: An iterable of cards which need to be checked
         :returns: Whether all cards in the provided iterable are in this Hand
         """
-        return all(card in self.cards for card in cards)
+        mask = 0
+        for card in cards:
+            mask |= CARD_BIT[card]
+        return self._bitboard & mask == mask
 
     def copy(self) -> 'Hand':
         """
@@ -239,7 +286,13 @@ class Hand(CardCollection):
 
         :returns: A deep copy of this hand. Changes to the original will not affect the copy and vice versa.
         """
-        return Hand(list(self.cards), max_size=self.max_size)
+        # The copy is made without checking the cards again, they are the same as the ones of this hand
+        new_hand = Hand.__new__(Hand)
+        new_hand.max_size = self.max_size
+        new_hand._cards = self._cards
+        new_hand._bitboard = self._bitboard
+        new_hand._shared = self._shared = True
+        return new_hand
 
     def is_empty(self) -> bool:
         """
@@ -247,21 +300,33 @@ class Hand(CardCollection):
 
         :returns: A bool indicating whether the hand is empty
         """
-        return len(self.cards) == 0
+        return self._bitboard == 0
 
     def get_cards(self) -> list[Card]:
-        return list(self.cards)
+        return list(self._cards)
 
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __contains__(self, item: Any) -> bool:
+        assert isinstance(item, Card), "Only cards can be contained in a card collection"
+        return self._bitboard & CARD_BIT[item] != 0
+
+    # The filters keep the order of the cards in the hand, the bitboard only tells whether there is anything to collect.
     def filter_suit(self, suit: Suit) -> Iterable[Card]:
-        results = [card for card in self.cards if card.suit is suit]
+        if not self._bitboard & SUIT_MASK[suit]:
+            return []
+        results = [card for card in self._cards if card.suit is suit]
         return results
 
     def filter_rank(self, rank: Rank) -> Iterable[Card]:
-        results = [card for card in self.cards if card.rank is rank]
+        if not self._bitboard & RANK_MASK[rank]:
+            return []
+        results = [card for card in self._cards if card.rank is rank]
         return results
 
     def __repr__(self) -> str:
-        return f"Hand(cards={self.cards}, max_size={self.max_size})"
+        return f"Hand(cards={self._cards}, max_size={self.max_size})"
 
 
 class Talon(OrderedCardCollection):
@@ -280,22 +345,35 @@ class Talon(OrderedCardCollection):
         :param cards: The cards to be put on this talon, a defensive copy will be made.
         :param trump_suit: The trump suit of the Talon, important if there are no more cards to be taken.
         """
-        if cards:
-            trump_card_suit = list(cards)[-1].suit
+        super().__init__(cards)
+
+        # the trump suit is taken from the defensive copy, so the cards are only copied once
+        if self._cards:
+            trump_card_suit = self._cards[-1].suit
             assert not trump_suit or trump_card_suit == trump_suit, "If the trump suit is specified, and there are cards on the talon, the suit must be the same!"
             self.__trump_suit = trump_card_suit
         else:
             assert trump_suit
             self.__trump_suit = trump_suit
-
-        super().__init__(cards)
+        # whether the list of cards is shared with a copy, and must be copied before it is changed
+        self.__shared = False
 
     def copy(self) -> 'Talon':
         """
         Create an independent copy of this talon.
         """
-        # We do not need to make a copy of the cards as this happend in the constructor of Talon.
-        return Talon(self._cards, self.__trump_suit)
+        # The copy shares the list of cards with this talon, until one of them is changed (copy on write).
+        new_talon = Talon.__new__(Talon)
+        new_talon._cards = self._cards
+        new_talon.__trump_suit = self.__trump_suit
+        new_talon.__shared = self.__shared = True
+        return new_talon
+
+    def __own_cards(self) -> None:
+        """Make sure the list of cards is not shared with a copy of this talon, so it can be changed."""
+        if self.__shared:
+            self._cards = list(self._cards)
+            self.__shared = False
 
     def trump_exchange(self, new_trump: Card) -> Card:
         """
@@ -310,6 +388,7 @@ class Talon(OrderedCardCollection):
         assert new_trump.rank is Rank.JACK
         assert len(self._cards) >= 2
         assert new_trump.suit is self._cards[-1].suit
+        self.__own_cards()
         old_trump = self._cards.pop(len(self._cards) - 1)
         self._cards.append(new_trump)
         return old_trump
@@ -318,7 +397,9 @@ class Talon(OrderedCardCollection):
         """Draw a card from this Talon. This does not change the talon, btu rather returns a talon with the change applied and the card drawn"""
         assert len(self._cards) >= amount, f"There are only {len(self._cards)} on the Talon, but {amount} cards are requested"
         draw = self._cards[:amount]
-        self._cards = self._cards[amount:]
+        self.__own_cards()
+        # the drawn cards are removed in place, rather than copying the rest of the talon into a new list
+        del self._cards[:amount]
         return draw
 
     def trump_suit(self) -> Suit:
@@ -345,8 +426,8 @@ class Trick(ABC):
     A complete trick. This is, the move of the leader and if that was not an exchange, the move of the follower.
     """
 
-    cards: Iterable[Card] = field(init=False, repr=False, hash=False)
-    """All cards used as part of this trick. This includes cards used in marriages"""
+    cards: tuple[Card, ...] = field(init=False, repr=False, compare=False)
+    """All cards used as part of this trick. This includes cards used in marriages. It is set by the derived classes in __post_init__"""
 
     @abstractmethod
     def is_trump_exchange(self) -> bool:
@@ -362,19 +443,6 @@ class Trick(ABC):
         Returns the first part of this trick. Raises an Exceptption if this is not a Trick with two parts
         """
 
-    def __getattribute__(self, __name: str) -> Any:
-        if __name == "cards":
-            # We call the method to compute the card list
-            return object.__getattribute__(self, "_cards")()
-        return object.__getattribute__(self, __name)
-
-    @abstractmethod
-    def _cards(self) -> Iterable[Card]:
-        """
-        Get all cards used in this tick. This method should not be called directly.
-        Use the cards property instead.
-        """
-
 
 @dataclass(frozen=True)
 class ExchangeTrick(Trick):
@@ -388,17 +456,15 @@ class ExchangeTrick(Trick):
     trump_card: Card
     """The card at the bottom of the talon"""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cards", self.exchange.cards + (self.trump_card,))
+
     def is_trump_exchange(self) -> bool:
         return True
 
     def as_partial(self) -> 'PartialTrick':
         raise Exception("An Exchange Trick does not have a first part")
 
-    def _cards(self) -> Iterable[Card]:
-        exchange = self.exchange.cards
-        exchange.append(self.trump_card)
-        return exchange
-
 
 @dataclass(frozen=True)
 class PartialTrick:
@@ -426,20 +492,20 @@ class RegularTrick(Trick, PartialTrick):
     follower_move: RegularMove
     """The move played by the follower"""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cards", self.leader_move.cards + self.follower_move.cards)
+
     def is_trump_exchange(self) -> bool:
         return False
 
     def as_partial(self) -> PartialTrick:
         return PartialTrick(self.leader_move)
 
-    def _cards(self) -> Iterable[Card]:
-        return itertools.chain(self.leader_move.cards, self.follower_move.cards)
-
     def __repr__(self) -> str:
         return f"RegularTrick(leader_move={self.leader_move}, follower_move={self.follower_move})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Score:
     """
     The score of one of the bots. This consists of the current points and potential pending points because of an earlier played marriage.
@@ -481,7 +547,7 @@ class GamePhase(Enum):
     TWO = 2
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BotState:
     """A bot with its implementation and current state in a game"""
 
@@ -489,6 +555,7 @@ class BotState:
     hand: Hand
     score: Score = field(default_factory=Score)
     won_cards: list[Card] = field(default_factory=list)
+    """The cards won in tricks. This list is never changed in place, but replaced when cards are won, so copies of the BotState share it."""
 
     def get_move(self, state: 'PlayerPerspective', leader_move: Optional[Move]) -> Move:
         """
@@ -514,7 +581,7 @@ class BotState:
             implementation=self.implementation,
             hand=self.hand.copy(),
             score=self.score,  # does not need a copy because it is not mutable
-            won_cards=list(self.won_cards),
+            won_cards=self.won_cards,  # does not need a copy because it is replaced rather than changed
         )
         return new_bot
 
@@ -523,7 +590,7 @@ class BotState:
                f"score={self.score}, won_cards={self.won_cards})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Previous:
     """
     Information about the previous GameState.
@@ -536,6 +603,15 @@ class Previous:
     """The trick which led to the current Gamestate from the Previous state"""
     leader_remained_leader: bool
     """Did the leader of remain the leader."""
+    past_tricks_bitboard: int = field(init=False, repr=False, compare=False)
+    """The bitboard (see deck.CARD_BIT) of all cards used in this trick and the ones before it, kept up to date one trick at a time."""
+
+    def __post_init__(self) -> None:
+        earlier = self.state.previous
+        bitboard = earlier.past_tricks_bitboard if earlier else 0
+        for card in self.trick.cards:
+            bitboard |= CARD_BIT[card]
+        object.__setattr__(self, "past_tricks_bitboard", bitboard)
 
 
 @dataclass
@@ -549,18 +625,20 @@ class GameState:
     """The current leader, i.e., the one who will play the first move in the next trick"""
     follower: BotState
     """The current follower, i.e., the one who will play the second move in the next trick"""
-    trump_suit: Suit = field(init=False)
-    """The trump suit in this game. This information is also in the Talon."""
     talon: Talon
     """The talon, containing the cards not yet in the hand of the player and the trump card at the bottom"""
     previous: Optional[Previous]
     """The events which led to this GameState, or None, if this is the initial GameState (or previous tricks and states are unknown)"""
+    legal_moves_memo: dict[Tuple['MoveValidator', Optional[Move]], tuple[Move, ...]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """
+    The legal moves found by a SchnapsenMoveValidator for this state, for the leader (with None as move) or for the follower after the leader's move.
+    A state is not changed anymore once bots get to see it, and the copies of a state start without them.
+    """
 
-    def __getattribute__(self, __name: str) -> Any:
-        if __name == "trump_suit":
-            # We get it from the talon
-            return self.talon.trump_suit()
-        return object.__getattribute__(self, __name)
+    @property
+    def trump_suit(self) -> Suit:
+        """The trump suit in this game. This information is also in the Talon, we get it from there."""
+        return self.talon.trump_suit()
 
     def copy_for_next(self) -> 'GameState':
         """
@@ -620,9 +698,15 @@ class PlayerPerspective(ABC):
     This class has several convenience methods to get more information about the current state.
     """
 
+    # A perspective is made for every move asked from a bot, so the perspectives do not get a __dict__.
+    # Each class lists the (name mangled) attributes it sets itself.
+    __slots__ = ("__game_state", "__engine", "__predicted_assumptions")
+
     def __init__(self, state: 'GameState', engine: 'GamePlayEngine') -> None:
         self.__game_state = state
         self.__engine = engine
+        # the predictions of make_assumption_ML, per leader move and own move
+        self.__predicted_assumptions: dict[Tuple[Optional[Move], Move], Tuple[list[Card], list[Card], list[Card], float]] = {}
 
     @abstractmethod
     def valid_moves(self) -> list[Move]:
@@ -641,10 +725,9 @@ class PlayerPerspective(ABC):
         The last pair will contain the current PlayerGameState.
         """
 
-        # We reconstruct the history backwards.
-        game_state_history: list[Tuple[PlayerPerspective, Optional[Trick]]] = []
-        # We first push the current state to the end
-        game_state_history.insert(0, (self, None))
+        # We reconstruct the history backwards, appending the records from the last to the first, and reverse them at the end.
+        # We first push the current state, it ends up at the end
+        game_state_history: list[Tuple[PlayerPerspective, Optional[Trick]]] = [(self, None)]
 
         current_leader = self.am_i_leader()
         current = self.__game_state.previous
@@ -666,9 +749,10 @@ class PlayerPerspective(ABC):
                 else:
                     current_player_state = FollowerPerspective(current.state, self.__engine, current.trick.as_partial().leader_move)
             history_record = (current_player_state, current.trick)
-            game_state_history.insert(0, history_record)
+            game_state_history.append(history_record)
 
             current = current.state.previous
+        game_state_history.reverse()
         return game_state_history
 
     @abstractmethod
@@ -742,33 +826,30 @@ class PlayerPerspective(ABC):
 
         :param leader_move: The move made by the leader of the trick. These cards have also been seen until now.
         """
-        bot = self.__get_own_bot_state()
+        return OrderedCardCollection(bitboard_cards(self.__seen_cards_bitboard(leader_move)))
 
-        seen_cards: set[Card] = set()  # We make it a set to remove duplicates
+    def __seen_cards_bitboard(self, leader_move: Optional[Move]) -> int:
+        """Get the bitboard (see deck.CARD_BIT) of all cards your bot has seen until now, see seen_cards."""
+        bot = self.__get_own_bot_state()
 
-        # in own hand
-        seen_cards.update(bot.hand)
+        # in own hand, and all cards which were played in Tricks (icludes marriages and Trump exchanges)
+        seen_cards = bot.hand.bitboard | self.__past_tricks_bitboard()
 
         # the trump card
         trump = self.get_trump_card()
         if trump:
-            seen_cards.add(trump)
-
-        # all cards which were played in Tricks (icludes marriages and Trump exchanges)
+            seen_cards |= CARD_BIT[trump]
 
-        seen_cards.update(self.__past_tricks_cards())
         if leader_move is not None:
-            seen_cards.update(leader_move.cards)
+            for card in leader_move.cards:
+                seen_cards |= CARD_BIT[card]
 
-        return OrderedCardCollection(seen_cards)
+        return seen_cards
 
-    def __past_tricks_cards(self) -> set[Card]:
-        past_cards: set[Card] = set()
+    def __past_tricks_bitboard(self) -> int:
+        """Get the bitboard of all cards which were played in the tricks so far, which the engine keeps in the previous records."""
         prev = self.__game_state.previous
-        while prev:
-            past_cards.update(prev.trick.cards)
-            prev = prev.state.previous
-        return past_cards
+        return prev.past_tricks_bitboard if prev else 0
 
     def get_known_cards_of_opponent_hand(self) -> CardCollection:
         """Get all cards which are in the opponents hand, but known to your Bot. This includes cards earlier used in marriages, or a trump exchange.
@@ -777,8 +858,8 @@ class PlayerPerspective(ABC):
         if self.get_phase() == GamePhase.TWO:
             return opponent_hand
         # We only disclose cards which have been part of a move, i.e., an Exchange or a Marriage
-        past_trick_cards = self.__past_tricks_cards()
-        return OrderedCardCollection(filter(lambda c: c in past_trick_cards, opponent_hand))
+        past_trick_cards = self.__past_tricks_bitboard()
+        return OrderedCardCollection([card for card in opponent_hand if CARD_BIT[card] & past_trick_cards])
 
     def get_engine(self) -> 'GamePlayEngine':
         """
@@ -796,10 +877,10 @@ class PlayerPerspective(ABC):
         """
 
         if self.get_phase() == GamePhase.TWO:
-            return self.__game_state.copy_with_other_bots(_DummyBot(), _DummyBot())
+            return self.__game_state.copy_with_other_bots(_DUMMY_BOT, _DUMMY_BOT)
         raise AssertionError("You cannot get the state in phase one")
 
-    def make_assumption(self, leader_move: Optional[Move], rand: Random) -> GameState:
+    def make_assumption(self, leader_move: Optional[Move], rand: Random) -> Tuple[GameState, Optional[float]]:
         """
         Takes the current imperfect information state and makes a random guess as to the position of the unknown cards.
         This also takes into account cards seen earlier during marriages played by the opponent, as well as potential trump jack exchanges
@@ -809,7 +890,7 @@ class PlayerPerspective(ABC):
         :param leader_move: the optional already executed leader_move in the current trick. This card is guaranteed to be in the hand of the leader in the returned GameState.
         :param rand: the source of random numbers to do the random assignment of unknown cards
 
-        :returns: A perfect information state object.
+        :returns: A perfect information state object, and in phase one the share of the opponent hand which was guessed right (None in phase two).
         """
         opponent_hand = self.__get_opponent_bot_state().hand.copy()
 
@@ -817,53 +898,40 @@ class PlayerPerspective(ABC):
             self.__game_state.leader.hand.get_cards()
             assert all(card in opponent_hand for card in leader_move.cards), f"The specified leader_move {leader_move} is not in the hand of the opponent {opponent_hand}"
 
-        full_state = self.__game_state.copy_with_other_bots(_DummyBot(), _DummyBot())
+        full_state = self.__game_state.copy_with_other_bots(_DUMMY_BOT, _DUMMY_BOT)
         if self.get_phase() == GamePhase.TWO:
             return full_state, None
 
-        seen_cards = self.seen_cards(leader_move)
+        seen_cards = self.__seen_cards_bitboard(leader_move)
         full_deck = self.__engine.deck_generator.get_initial_deck()
 
         opponent_hand = self.__get_opponent_bot_state().hand.copy()
-        unseen_opponent_hand = list(filter(lambda card: card not in seen_cards, opponent_hand))
+        unseen_opponent_hand = [card for card in opponent_hand if not CARD_BIT[card] & seen_cards]
 
         talon = full_state.talon
-        unseen_talon = list(filter(lambda card: card not in seen_cards, talon))
+        unseen_talon = [card for card in talon if not CARD_BIT[card] & seen_cards]
 
-        unseen_cards = list(filter(lambda card: card not in seen_cards, full_deck))
+        unseen_cards = [card for card in full_deck if not CARD_BIT[card] & seen_cards]
         rand.shuffle(unseen_cards)
 
         assert len(unseen_talon) + len(unseen_opponent_hand) == len(unseen_cards), "Logical error. The number of unseen cards in the opponents hand and in the talon must be equal to the number of unseen cards"
 
-        new_talon = []
-        for card in talon:
-            if card in unseen_talon:
-                # take one of the random cards
-                new_talon.append(unseen_cards.pop())
-            else:
-                new_talon.append(card)
+        # each unseen card of the talon, and then of the opponent hand, takes one of the random cards
+        new_talon = [card if CARD_BIT[card] & seen_cards else unseen_cards.pop() for card in talon]
 
         full_state.talon = Talon(new_talon)
 
-        new_opponent_hand = []
-        for card in opponent_hand:
-            if card in unseen_opponent_hand:
-                new_opponent_hand.append(unseen_cards.pop())
-            else:
-                new_opponent_hand.append(card)
+        new_opponent_hand = [card if CARD_BIT[card] & seen_cards else unseen_cards.pop() for card in opponent_hand]
         if self.am_i_leader():
             full_state.follower.hand = Hand(new_opponent_hand)
         else:
             full_state.leader.hand = Hand(new_opponent_hand)
 
         assert len(unseen_cards) == 0, "All cards must be consumed by either the opponent hand or talon by now"
-        count = 0
-        for card in opponent_hand:
-            if card in new_opponent_hand:
-                count += 1
+        count = sum(1 for card in opponent_hand if card in new_opponent_hand)
         return full_state, count/5
 
-    def make_assumption_ML(self, leader_move: Optional[Move], rand: Random, my_move: Move) -> GameState:
+    def make_assumption_ML(self, leader_move: Optional[Move], rand: Random, my_move: Move) -> Tuple[GameState, Optional[float]]:
         """
         Takes the current imperfect information state and makes a random guess as to the position of the unknown cards.
         This also takes into account cards seen earlier during marriages played by the opponent, as well as potential trump jack exchanges
@@ -873,23 +941,51 @@ class PlayerPerspective(ABC):
         :param leader_move: the optional already executed leader_move in the current trick. This card is guaranteed to be in the hand of the leader in the returned GameState.
         :param rand: the source of random numbers to do the random assignment of unknown cards
 
-        :returns: A perfect information state object.
+        :returns: A perfect information state object, and in phase one the share of the opponent hand which was guessed right (None in phase two).
         """
         opponent_hand = self.__get_opponent_bot_state().hand.copy()
 
         
         if leader_move is not None:
             self.__game_state.leader.hand.get_cards()
-            # get the leader's move representation, even if it is None
-            leader_move_representation = self.get_move_feature_vector(leader_move)
             assert all(card in opponent_hand for card in leader_move.cards), f"The specified leader_move {leader_move} is not in the hand of the opponent {opponent_hand}"
 
-        full_state = self.__game_state.copy_with_other_bots(_DummyBot(), _DummyBot())
+        full_state = self.__game_state.copy_with_other_bots(_DUMMY_BOT, _DUMMY_BOT)
         if self.get_phase() == GamePhase.TWO:
             return full_state, None
-        
-        model = joblib.load("ML_models/predict_hands")
-        seen_cards = self.seen_cards(leader_move)
+
+        # The opponent hand is predicted the same way for every sample made for a move, only the order of the unseen talon cards is random.
+        # So the prediction is made once per move, and each sample only shuffles the cards left for the talon.
+        assumption_key = (leader_move, my_move)
+        predicted_assumption = self.__predicted_assumptions.get(assumption_key)
+        if predicted_assumption is None:
+            predicted_assumption = self.__predict_assumption(leader_move, my_move, opponent_hand, full_state.talon)
+            self.__predicted_assumptions[assumption_key] = predicted_assumption
+        new_opponent_hand, unseen_talon_cards, seen_talon, count = predicted_assumption
+
+        unseen_cards = list(unseen_talon_cards)
+        rand.shuffle(unseen_cards)
+        # the shuffled cards are put on the talon in reverse, above the cards of the talon which were seen
+        full_state.talon = Talon(unseen_cards[::-1] + seen_talon)
+
+        if self.am_i_leader():
+            full_state.follower.hand = Hand(list(new_opponent_hand))
+        else:
+            full_state.leader.hand = Hand(list(new_opponent_hand))
+        return full_state, count
+
+    def __predict_assumption(self, leader_move: Optional[Move], my_move: Move, opponent_hand: Hand, talon: Talon) -> Tuple[list[Card], list[Card], list[Card], float]:
+        """
+        Predict the hand of the opponent for make_assumption_ML, using the hand prediction model.
+
+        :returns: the predicted opponent hand, the unseen cards left for the talon, the seen cards of the talon,
+            and the fraction of the actual opponent hand which was predicted
+        """
+        if leader_move is not None:
+            # get the leader's move representation, even if it is None
+            leader_move_representation = self.get_move_feature_vector(leader_move)
+        model = _load_model("ML_models/predict_hands")
+        seen_cards = self.__seen_cards_bitboard(leader_move)
         full_deck = self.__engine.deck_generator.get_initial_deck()
         # get the sate feature representation
         state_representation = self.get_state_feature_vector()
@@ -937,8 +1033,8 @@ class PlayerPerspective(ABC):
                 raise AssertionError("Provided card Rank does not exist!")
             index = rank_index + suit_index
             prediction[index] = 0
-        seen_opponent_hand = list(filter(lambda card: card in seen_cards, opponent_hand))
-        unseen_opponent_hand = list(filter(lambda card: card not in seen_cards, opponent_hand))
+        seen_opponent_hand = [card for card in opponent_hand if CARD_BIT[card] & seen_cards]
+        unseen_opponent_hand = [card for card in opponent_hand if not CARD_BIT[card] & seen_cards]
         for card in seen_opponent_hand:
             card_suit = card.suit
             card_rank = card.rank
@@ -966,10 +1062,9 @@ class PlayerPerspective(ABC):
                 raise AssertionError("Provided card Rank does not exist!")
             index = rank_index + suit_index
             prediction[index] = 0
-            
-        talon = full_state.talon
-        seen_talon = list(filter(lambda card: card in seen_cards, talon))
-        unseen_talon = list(filter(lambda card: card not in seen_cards, talon))
+
+        seen_talon = [card for card in talon if CARD_BIT[card] & seen_cards]
+        unseen_talon = [card for card in talon if not CARD_BIT[card] & seen_cards]
         for card in seen_talon:
             card_suit = card.suit
             card_rank = card.rank
@@ -998,7 +1093,7 @@ class PlayerPerspective(ABC):
             index = rank_index + suit_index
             prediction[index] = 0
             
-        unseen_cards = list(filter(lambda card: card not in seen_cards, full_deck))
+        unseen_cards = [card for card in full_deck if not CARD_BIT[card] & seen_cards]
         assert len(unseen_talon) + len(unseen_opponent_hand) == len(unseen_cards), "Logical error. The number of unseen cards in the opponents hand and in the talon must be equal to the number of unseen cards"
         new_opponent_hand = []
         if len(seen_opponent_hand) != 0:
@@ -1030,28 +1125,11 @@ class PlayerPerspective(ABC):
                 new_opponent_hand.append(Card.get_card(rank, suit))
                 unseen_cards.pop(unseen_cards.index(Card.get_card(rank, suit)))
             prediction[pred_index] = 0
-        rand.shuffle(unseen_cards)
-        new_talon = []
-        for i in range(len(unseen_cards)):
-            new_talon.append(unseen_cards.pop())
-        for card in talon:
-            if card in seen_talon:
-                new_talon.append(card)
-
-        full_state.talon = Talon(new_talon)
-
-        if self.am_i_leader():
-            full_state.follower.hand = Hand(new_opponent_hand)
-        else:
-            full_state.leader.hand = Hand(new_opponent_hand)
-
-        
-        assert len(unseen_cards) == 0, "All cards must be consumed by either the opponent hand or talon by now"
         count = 0
         for card in opponent_hand:
             if card in new_opponent_hand:
                 count += 1
-        return full_state, count/5
+        return new_opponent_hand, unseen_cards, seen_talon, count/5
     
     def get_one_hot_encoding_of_card_suit(self, card_suit: Suit) -> List[int]:
         """
@@ -1125,15 +1203,15 @@ class PlayerPerspective(ABC):
             # in case the move is a marriage move
             if move.is_marriage():
                 move_type_one_hot_encoding = [0, 0, 1]
-                card = move.queen_card
+                card = move.as_marriage().queen_card
             #  in case the move is a trump exchange move
             elif move.is_trump_exchange():
                 move_type_one_hot_encoding = [0, 1, 0]
-                card = move.jack
+                card = move.as_trump_exchange().jack
             #  in case it is a regular move
             else:
                 move_type_one_hot_encoding = [1, 0, 0]
-                card = move.card
+                card = move.as_regular_move().card
             move_type_one_hot_encoding_numpy_array = move_type_one_hot_encoding
             card_rank_one_hot_encoding_numpy_array = self.get_one_hot_encoding_of_card_rank(card.rank)
             card_suit_one_hot_encoding_numpy_array = self.get_one_hot_encoding_of_card_suit(card.suit)
@@ -1338,8 +1416,14 @@ class _DummyBot(Bot):
         raise Exception("The GameState from make_assumption removes the real bots from the Game. If you want to continue the game, provide new Bots. See copy_with_other_bots in the GameState class.")
 
 
+_DUMMY_BOT = _DummyBot()
+"""The bot replacing both real bots in the states from make_assumption. It has no state, so one is shared by all of them."""
+
+
 class LeaderPerspective(PlayerPerspective):
 
+    __slots__ = ("__game_state", "__engine")
+
     def __init__(self, state: 'GameState', engine: 'GamePlayEngine') -> None:
         super().__init__(state, engine)
         self.__game_state = state
@@ -1366,16 +1450,19 @@ class LeaderPerspective(PlayerPerspective):
         return True
 
     def get_won_cards(self) -> CardCollection:
-        return OrderedCardCollection(self.__game_state.leader.won_cards)
+        return OrderedCardCollection.view(self.__game_state.leader.won_cards)
 
     def get_opponent_won_cards(self) -> CardCollection:
-        return OrderedCardCollection(self.__game_state.follower.won_cards)
+        return OrderedCardCollection.view(self.__game_state.follower.won_cards)
 
     def __repr__(self) -> str:
         return f"LeaderPerspective(state={self.__game_state}, engine={self.__engine})"
 
 
 class FollowerPerspective(PlayerPerspective):
+
+    __slots__ = ("__game_state", "__engine", "__partial_trick")
+
     def __init__(self, state: 'GameState', engine: 'GamePlayEngine', partial_trick: Optional[Move]) -> None:
         super().__init__(state, engine)
         self.__game_state = state
@@ -1403,10 +1490,10 @@ class FollowerPerspective(PlayerPerspective):
         return False
 
     def get_won_cards(self) -> CardCollection:
-        return OrderedCardCollection(self.__game_state.follower.won_cards)
+        return OrderedCardCollection.view(self.__game_state.follower.won_cards)
 
     def get_opponent_won_cards(self) -> CardCollection:
-        return OrderedCardCollection(self.__game_state.leader.won_cards)
+        return OrderedCardCollection.view(self.__game_state.leader.won_cards)
 
     def __repr__(self) -> str:
         return f"FollowerPerspective(state={self.__game_state}, engine={self.__engine}, partial_trick={self.__partial_trick})"
@@ -1418,6 +1505,8 @@ class ExchangeFollowerPerspective(PlayerPerspective):
     This state is does not allow any moves.
     """
 
+    __slots__ = ("__game_state",)
+
     def __init__(self, state: 'GameState', engine: 'GamePlayEngine') -> None:
         self.__game_state = state
         super().__init__(state, engine)
@@ -1447,10 +1536,10 @@ class ExchangeFollowerPerspective(PlayerPerspective):
         return self.__game_state.leader.hand.copy()
 
     def get_opponent_won_cards(self) -> CardCollection:
-        return OrderedCardCollection(self.__game_state.leader.won_cards)
+        return OrderedCardCollection.view(self.__game_state.leader.won_cards)
 
     def get_won_cards(self) -> CardCollection:
-        return OrderedCardCollection(self.__game_state.follower.won_cards)
+        return OrderedCardCollection.view(self.__game_state.follower.won_cards)
 
     def am_i_leader(self) -> bool:
         return False
@@ -1459,6 +1548,8 @@ class ExchangeFollowerPerspective(PlayerPerspective):
 class WinnerPerspective(LeaderPerspective):
     """The gamestate given to the winner of the game at the very end"""
 
+    __slots__ = ("__game_state", "__engine")
+
     def __init__(self, state: 'GameState', engine: 'GamePlayEngine') -> None:
         self.__game_state = state
         self.__engine = engine
@@ -1474,6 +1565,8 @@ class WinnerPerspective(LeaderPerspective):
 class LoserPerspective(FollowerPerspective):
     """The gamestate given to the loser of the game at the very end"""
 
+    __slots__ = ("__game_state", "__engine")
+
     def __init__(self, state: 'GameState', engine: 'GamePlayEngine') -> None:
         self.__game_state = state
         self.__engine = engine
@@ -1505,17 +1598,19 @@ class DeckGenerator(ABC):
         """
         the_cards = list(deck.get_cards())
         rng.shuffle(the_cards)
-        return OrderedCardCollection(the_cards)
+        # the_cards is a fresh list, used by nothing else, so it does not need the copy of the constructor
+        return OrderedCardCollection.view(the_cards)
 
 
 class SchnapsenDeckGenerator(DeckGenerator):
 
+    # The deck is the same for every game, and an OrderedCardCollection cannot be changed, so the one deck is returned by every call.
+    # Making assumptions asks for it for every sample.
+    _INITIAL_DECK = OrderedCardCollection(
+        [Card.get_card(rank, suit) for suit in Suit for rank in [Rank.JACK, Rank.QUEEN, Rank.KING, Rank.TEN, Rank.ACE]])
+
     def get_initial_deck(self) -> OrderedCardCollection:
-        deck = []
-        for suit in Suit:
-            for rank in [Rank.JACK, Rank.QUEEN, Rank.KING, Rank.TEN, Rank.ACE]:
-                deck.append(Card.get_card(rank, suit))
-        return OrderedCardCollection(deck)
+        return SchnapsenDeckGenerator._INITIAL_DECK
 
 
 class HandGenerator(ABC):
@@ -1536,8 +1631,8 @@ class SchnapsenHandGenerator(HandGenerator):
     @classmethod
     def generateHands(self, cards: OrderedCardCollection) -> Tuple[Hand, Hand, Talon]:
         the_cards = list(cards.get_cards())
-        hand1 = Hand([the_cards[i] for i in range(0, 10, 2)], max_size=5)
-        hand2 = Hand([the_cards[i] for i in range(1, 11, 2)], max_size=5)
+        hand1 = Hand(the_cards[0:10:2], max_size=5)
+        hand2 = Hand(the_cards[1:10:2], max_size=5)
         rest = Talon(the_cards[10:])
         return (hand1, hand2, rest)
 
@@ -1618,9 +1713,9 @@ class SchnapsenTrickImplementer(TrickImplementer):
         # important: the winner takes the first card of the talon, the loser the second one.
         # this also ensures that the loser of the last trick of the first phase gets the face up trump
         if not next_game_state.talon.is_empty():
-            drawn = iter(next_game_state.talon.draw_cards(2))
-            next_game_state.leader.hand.add(next(drawn))
-            next_game_state.follower.hand.add(next(drawn))
+            winner_card, loser_card = next_game_state.talon.draw_cards(2)
+            next_game_state.leader.hand.add(winner_card)
+            next_game_state.follower.hand.add(loser_card)
 
         next_game_state.previous = Previous(game_state, trick=trick, leader_remained_leader=leader_remained_leader)
 
@@ -1630,7 +1725,7 @@ class SchnapsenTrickImplementer(TrickImplementer):
         # ask first players move trough the requester
         leader_game_state = LeaderPerspective(game_state, game_engine)
         leader_move = game_engine.move_requester.get_move(game_state.leader, leader_game_state, None)
-        if not game_engine.move_validator.is_legal_leader_move(game_engine, game_state, leader_move):
+        if game_engine.validate_moves and not game_engine.move_validator.is_legal_leader_move(game_engine, game_state, leader_move):
             raise Exception(f"Leader {game_state.leader.implementation} played an illegal move")
 
         return leader_move
@@ -1653,7 +1748,7 @@ class SchnapsenTrickImplementer(TrickImplementer):
         follower_game_state = FollowerPerspective(game_state, game_engine, partial_trick)
 
         follower_move = game_engine.move_requester.get_move(game_state.follower, follower_game_state, partial_trick)
-        if not game_engine.move_validator.is_legal_follower_move(game_engine, game_state, partial_trick, follower_move):
+        if game_engine.validate_moves and not game_engine.move_validator.is_legal_follower_move(game_engine, game_state, partial_trick, follower_move):
             raise Exception(f"Follower {game_state.follower.implementation} played an illegal move")
         return cast(RegularMove, follower_move)
 
@@ -1728,20 +1823,44 @@ class MoveValidator(ABC):
 
 class SchnapsenMoveValidator(MoveValidator):
 
+    # Moves cannot be changed, so there is one Marriage for each queen, shared by all the lists of legal moves it is in.
+    _MARRIAGES: dict[Card, Marriage] = {
+        Card.get_card(Rank.QUEEN, suit): Marriage(Card.get_card(Rank.QUEEN, suit), Card.get_card(Rank.KING, suit)) for suit in Suit}
+    # Likewise, there is one Trump_Exchange for each trump suit, the trump suit does not change during a game.
+    _TRUMP_EXCHANGES: dict[Suit, Trump_Exchange] = {suit: Trump_Exchange(Card.get_card(Rank.JACK, suit)) for suit in Suit}
+
+    # The legal moves are asked for more than once per state: by the bot through valid_moves, and by the engine to validate the move it got.
+    # So they are remembered on the state, as a tuple, which the callers cannot change.
     def get_legal_leader_moves(self, game_engine: 'GamePlayEngine', game_state: GameState) -> Iterable[Move]:
+        memo_key = (self, None)
+        legal_moves = game_state.legal_moves_memo.get(memo_key)
+        if legal_moves is None:
+            legal_moves = tuple(self.__get_legal_leader_moves(game_engine, game_state))
+            game_state.legal_moves_memo[memo_key] = legal_moves
+        return legal_moves
+
+    def get_legal_follower_moves(self, game_engine: 'GamePlayEngine', game_state: GameState, partial_trick: Move) -> Iterable[Move]:
+        memo_key = (self, partial_trick)
+        legal_moves = game_state.legal_moves_memo.get(memo_key)
+        if legal_moves is None:
+            legal_moves = tuple(self.__get_legal_follower_moves(game_engine, game_state, partial_trick))
+            game_state.legal_moves_memo[memo_key] = legal_moves
+        return legal_moves
+
+    def __get_legal_leader_moves(self, game_engine: 'GamePlayEngine', game_state: GameState) -> list[Move]:
         # all cards in the hand can be played
         cards_in_hand = game_state.leader.hand
-        valid_moves: list[Move] = [RegularMove(card) for card in cards_in_hand]
+        valid_moves: list[Move] = RegularMove.from_cards(cards_in_hand.cards)
         # trump exchanges
         if not game_state.talon.is_empty():
-            trump_jack = Card.get_card(Rank.JACK, game_state.trump_suit)
-            if trump_jack in cards_in_hand:
-                valid_moves.append(Trump_Exchange(trump_jack))
+            trump_exchange = SchnapsenMoveValidator._TRUMP_EXCHANGES[game_state.trump_suit]
+            if trump_exchange.jack in cards_in_hand:
+                valid_moves.append(trump_exchange)
         # mariages
         for card in cards_in_hand.filter_rank(Rank.QUEEN):
-            king_card = Card.get_card(Rank.KING, card.suit)
-            if king_card in cards_in_hand:
-                valid_moves.append(Marriage(card, king_card))
+            marriage = SchnapsenMoveValidator._MARRIAGES[card]
+            if marriage.king_card in cards_in_hand:
+                valid_moves.append(marriage)
         return valid_moves
 
     def is_legal_leader_move(self, game_engine: 'GamePlayEngine', game_state: GameState, move: Move) -> bool:
@@ -1759,7 +1878,7 @@ class SchnapsenMoveValidator(MoveValidator):
         regular_move = cast(RegularMove, move)
         return regular_move.card in cards_in_hand
 
-    def get_legal_follower_moves(self, game_engine: 'GamePlayEngine', game_state: GameState, partial_trick: Move) -> Iterable[Move]:
+    def __get_legal_follower_moves(self, game_engine: 'GamePlayEngine', game_state: GameState, partial_trick: Move) -> list[Move]:
         hand = game_state.follower.hand
         if partial_trick.is_marriage():
             leader_card = cast(Marriage, partial_trick).queen_card
@@ -1767,7 +1886,7 @@ class SchnapsenMoveValidator(MoveValidator):
             leader_card = cast(RegularMove, partial_trick).card
         if game_state.game_phase() is GamePhase.ONE:
             # no need to follow, any card in the hand is a legal move
-            return RegularMove.from_cards(hand.get_cards())
+            return RegularMove.from_cards(hand.cards)
         # information from https://www.pagat.com/marriage/schnaps.html
         # ## original formulation ##
         # if your opponent leads a non-trump:
@@ -1784,26 +1903,24 @@ class SchnapsenMoveValidator(MoveValidator):
         # failing this, you must play a lower card of the same suit;
         # --new--> failing this, if the opponen did not play a trump, you must play a trump
         # failing this, you can play anything
-        leader_card_score = game_engine.trick_scorer.rank_to_points(leader_card.rank)
+        # the scorer is looked up once, it is needed for the leader card and every card of the same suit
+        rank_to_points = game_engine.trick_scorer.rank_to_points
+        leader_card_score = rank_to_points(leader_card.rank)
         # you must play a higher card of the same suit if you can;
         same_suit_cards = hand.filter_suit(leader_card.suit)
         if same_suit_cards:
-            higher_same_suit, lower_same_suit = [], []
-            for card in same_suit_cards:
-                # TODO this is slightly ambigousm should this be >= ??
-                higher_same_suit.append(card) if game_engine.trick_scorer.rank_to_points(card.rank) > leader_card_score else lower_same_suit.append(card)
+            # TODO this is slightly ambigousm should this be >= ??
+            higher_same_suit = [card for card in same_suit_cards if rank_to_points(card.rank) > leader_card_score]
             if higher_same_suit:
                 return RegularMove.from_cards(higher_same_suit)
-        # failing this, you must play a lower card of the same suit;
-            elif lower_same_suit:
-                return RegularMove.from_cards(lower_same_suit)
-            raise AssertionError("Somethign is wrong in the logic here. There should be cards, but they are neither placed in the low, nor higher list")
+            # failing this, you must play a lower card of the same suit; without a higher one, that is every card of the suit
+            return RegularMove.from_cards(same_suit_cards)
         # failing this, if the opponen did not play a trump, you must play a trump
         trump_cards = hand.filter_suit(game_state.trump_suit)
         if leader_card.suit != game_state.trump_suit and trump_cards:
             return RegularMove.from_cards(trump_cards)
         # failing this, you can play anything
-        return RegularMove.from_cards(hand.get_cards())
+        return RegularMove.from_cards(hand.cards)
 
 
 class TrickScorer(ABC):
@@ -1879,28 +1996,20 @@ class SchnapsenTrickScorer(TrickScorer):
         follower_card_points = self.rank_to_points(follower_card.rank)
 
         if leader_card.suit is follower_card.suit:
-            # same suit, either trump or not
-            if leader_card_points > follower_card_points:
-                leader_wins = True
-            else:
-                leader_wins = False
-        elif leader_card.suit is trump:
-            # the follower suit cannot be trumps as per the previous condition
-            leader_wins = True
-        elif follower_card.suit is trump:
-            # the leader suit cannot be trumps because of the previous conditions
-            leader_wins = False
+            # same suit, either trump or not, the higher card wins
+            leader_wins = leader_card_points > follower_card_points
         else:
-            # the follower did not follow the suit of the leader and did not play trumps, hence the leader wins
-            leader_wins = True
+            # different suits: the follower only wins by playing a trump (then the leader did not play one).
+            # Otherwise either the leader played a trump, or the follower did not follow the suit of the leader and did not play trumps.
+            leader_wins = follower_card.suit is not trump
         winner, loser = (leader, follower) if leader_wins else (follower, leader)
         # record the win
-        winner.won_cards.extend([leader_card, follower_card])
+        winner.won_cards = winner.won_cards + [leader_card, follower_card]
         # apply the points
         points_gained = leader_card_points + follower_card_points
-        winner.score += Score(direct_points=points_gained)
         # add winner's total of direct and pending points as their new direct points
-        winner.score = winner.score.redeem_pending_points()
+        # (the same as adding Score(direct_points=points_gained) and redeeming the pending points, but with only one new Score)
+        winner.score = Score(direct_points=winner.score.direct_points + points_gained + winner.score.pending_points, pending_points=0)
         return winner, loser, leader_wins
 
     def declare_winner(self, game_state: GameState) -> Optional[Tuple[BotState, int]]:
@@ -1945,6 +2054,29 @@ class GamePlayEngine:
     move_requester: MoveRequester
     move_validator: MoveValidator
     trick_scorer: TrickScorer
+    validate_moves: bool = True
+    """
+    Whether the moves the bots play are checked with the move_validator. This can be turned off for games between bots which
+    only play moves from valid_moves, like the rollouts of search bots, see without_move_validation.
+    """
+    _without_validation: Optional['GamePlayEngine'] = field(default=None, init=False, repr=False, compare=False)
+    """The copy of this engine made by without_move_validation, made on its first call and returned by every later one"""
+
+    def without_move_validation(self) -> 'GamePlayEngine':
+        """
+        Get a copy of this engine, with the same rules, which does not check the moves the bots play.
+        Only use it for bots which only play moves from valid_moves. An illegal move would not raise an Exception, but corrupt the game.
+        Every call returns the same copy, so a search bot calling this for every move does not make a new engine each time.
+        """
+        if not self.validate_moves:
+            return self
+        engine = self._without_validation
+        if engine is None:
+            # a shallow copy, the parts of the engine have no state of their own
+            engine = copy.copy(self)
+            engine.validate_moves = False
+            self._without_validation = engine
+        return engine
 
     def play_game(self, bot1: Bot, bot2: Bot, rng: Random) -> Tuple[Bot, int, Score]:
         """
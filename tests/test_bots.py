@@ -1,6 +1,12 @@
 from unittest import TestCase
+from typing import Optional
 from schnapsen.bots import RandBot, AlphaBetaBot
 from schnapsen.game import SchnapsenGamePlayEngine
+# the ML bots import the engine as src.schnapsen, so they are tested with that engine and its cards
+from src.schnapsen.bots import BullyBot
+from src.schnapsen.bots.rdeep_ML import RdeepMLBot, OPPONENT_MODEL_PATHS
+from src.schnapsen import game as src_game
+import pathlib
 import random
 
 
@@ -24,3 +30,30 @@ class AlphaBetaBotTest(TestCase):
     def test_run(self) -> None:
         # TODO
         pass
+
+
+class _BullyPredictingRdeepMLBot(RdeepMLBot):
+    """A RdeepMLBot which always predicts the bully bot as opponent, so the test does not depend on the KNN model. It records its moves."""
+
+    def __init__(self, cache_talon_scores: bool) -> None:
+        super().__init__(num_samples=6, depth=3, rand=random.Random(4564654644))
+        self.CACHE_TALON_SCORES = cache_talon_scores
+        self.moves: list[src_game.Move] = []
+
+    def predict_opponent(self, state: src_game.PlayerPerspective) -> Optional[pathlib.Path]:
+        return OPPONENT_MODEL_PATHS[1]
+
+    def get_move(self, state: src_game.PlayerPerspective, leader_move: Optional[src_game.Move]) -> src_game.Move:
+        move = super().get_move(state, leader_move)
+        self.moves.append(move)
+        return move
+
+
+class RdeepMLBotTest(TestCase):
+    def test_cached_scores_choose_the_same_moves(self) -> None:
+        engine = src_game.SchnapsenGamePlayEngine()
+        for i in range(4):
+            cached, uncached = _BullyPredictingRdeepMLBot(True), _BullyPredictingRdeepMLBot(False)
+            for bot in (cached, uncached):
+                engine.play_game(bot, BullyBot(random.Random(i)), random.Random(i))
+            self.assertEqual(cached.moves, uncached.moves)
@@ -106,6 +106,17 @@ class CollectionTest(TestCase):
             for card in list_with_cards:
                 self.assertIn(card, collection)
 
+    def test_view(self) -> None:
+        for list_with_cards in CollectionTest.card_lists:
+            view = OrderedCardCollection.view(list_with_cards)
+            self.assertEqual(list(view), list(OrderedCardCollection(list_with_cards)))
+            self.assertEqual(len(view), len(list_with_cards))
+            # the cards it hands out are still a copy
+            cards = view.get_cards()
+            assert isinstance(cards, list)
+            cards.clear()
+            self.assertEqual(len(view), len(list_with_cards))
+
     def test_filer_suit(self) -> None:
         for collection in [OrderedCardCollection(card_list) for card_list in CollectionTest.card_lists]:
             for suit in Suit:
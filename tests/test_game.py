@@ -1,5 +1,5 @@
 from unittest import TestCase
-from schnapsen.deck import Card, Rank, Suit
+from schnapsen.deck import Card, Rank, Suit, CARD_BIT
 from schnapsen.game import (
     Trump_Exchange,
     Marriage,
@@ -54,7 +54,7 @@ class MoveTest(TestCase):
             self.assertTrue(marriage.is_marriage())
             self.assertFalse(marriage.is_trump_exchange())
             self.assertEqual(marriage.underlying_regular_move().cards[0], queen)
-            self.assertEqual(marriage.cards, [queen, king])
+            self.assertEqual(marriage.cards, (queen, king))
 
 
 class HandTest(TestCase):
@@ -144,6 +144,21 @@ class HandTest(TestCase):
         # modifying the copy must not modify the original
         copy.remove(Card.FIVE_CLUBS)
         self.assertEqual(hand.get_cards(), self.ten_cards)
+        # and modifying the original must not modify the copy
+        hand.remove(Card.JACK_HEARTS)
+        self.assertIn(Card.JACK_HEARTS, copy)
+
+    def test_copy_cards_are_read_only(self) -> None:
+        hand = Hand(self.ten_cards, max_size=10)
+        bitboard = hand.bitboard
+        # changing the cards handed out by a copy must not change the original, nor its bitboard
+        cards = hand.copy().cards
+        cards.clear()
+        self.assertEqual(hand.get_cards(), self.ten_cards)
+        self.assertEqual(hand.bitboard, bitboard)
+        self.assertIn(Card.FIVE_CLUBS, hand)
+        with self.assertRaises(AttributeError):
+            hand.cards = []  # type: ignore[misc]
 
     def test_filter_suit(self) -> None:
         hand = Hand(self.ten_cards, max_size=10)
@@ -164,6 +179,26 @@ class HandTest(TestCase):
         self.assertEqual(hand.filter_rank(Rank.KING), [])
         self.assertEqual(hand.filter_rank(Rank.THREE), [])
 
+    def test_filter_after_remove_and_add(self) -> None:
+        hand = Hand(self.ten_cards[:5], max_size=5)
+        hand.remove(Card.FIVE_CLUBS)
+        self.assertEqual(hand.filter_suit(Suit.CLUBS), [])
+        self.assertFalse(hand.has_cards([Card.FIVE_CLUBS]))
+        hand.add(Card.KING_CLUBS)
+        self.assertEqual(hand.filter_suit(Suit.CLUBS), [Card.KING_CLUBS])
+        self.assertEqual(hand.filter_rank(Rank.KING), [Card.KING_CLUBS])
+        self.assertTrue(hand.has_cards([Card.KING_CLUBS, Card.QUEEN_HEARTS]))
+
+    def test_bitboard(self) -> None:
+        hand = Hand(self.ten_cards[3:7], max_size=5)
+        # the duplicate queen is one bit, which stays while one of them is in the hand
+        self.assertEqual(hand.bitboard, sum(CARD_BIT[card] for card in [Card.TWO_HEARTS, Card.QUEEN_HEARTS, Card.JACK_SPADES]))
+        hand.remove(Card.QUEEN_HEARTS)
+        hand.add(Card.KING_CLUBS)
+        self.assertEqual(hand.bitboard, sum(CARD_BIT[card] for card in [Card.TWO_HEARTS, Card.QUEEN_HEARTS, Card.JACK_SPADES, Card.KING_CLUBS]))
+        hand.remove(Card.QUEEN_HEARTS)
+        self.assertEqual(hand.bitboard, sum(CARD_BIT[card] for card in [Card.TWO_HEARTS, Card.JACK_SPADES, Card.KING_CLUBS]))
+
 
 class TalonTest(TestCase):
 
@@ -218,6 +253,16 @@ class TalonTest(TestCase):
         with self.assertRaises(AssertionError):
             t.draw_cards(11)
 
+    def test_copy(self) -> None:
+        t = Talon(self.ten_cards)
+        copy = t.copy()
+        # drawing from, or exchanging on, one of them must not modify the other
+        copy.draw_cards(4)
+        self.assertEqual(t.get_cards(), self.ten_cards)
+        t.trump_exchange(Card.JACK_DIAMONDS)
+        self.assertEqual(copy.get_cards(), self.ten_cards[4:10])
+        self.assertEqual(copy.trump_suit(), Suit.DIAMONDS)
+
 
 class ScoreTest(TestCase):
 